@@ -22,6 +22,8 @@ class Settings(BaseSettings):
     # OpenAI API 설정
     openai_api_key: str = Field(default="your-openai-api-key-here", env="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4", env="OPENAI_MODEL")
+    openai_sql_model: Optional[str] = Field(None, env="OPENAI_SQL_MODEL")  # 미설정 시 openai_model 사용
+    openai_sql_max_tokens: int = Field(default=512, env="OPENAI_SQL_MAX_TOKENS")
     
     # 데이터베이스 설정
     database_url: str = Field(default="sqlite:///./ai_data_analyst.db", env="DATABASE_URL")
@@ -57,6 +59,8 @@ class Settings(BaseSettings):
     default_theme: str = Field(default="light", env="DEFAULT_THEME")  # light, dark, blue, green
     enable_animations: bool = Field(default=True, env="ENABLE_ANIMATIONS")
     max_excel_file_size_mb: int = Field(default=100, env="MAX_EXCEL_FILE_SIZE_MB")
+    ui_mode: str = Field(default="full", env="UI_MODE")  # full, lite (lite: 부가 패널은 요청 시 생성)
+    reload_mode: bool = Field(default=False, env="RELOAD_MODE")  # True면 레이아웃을 캐시하지 않고 매번 새로 생성
     
     class Config:
         env_file = ".env"
@@ -22,6 +22,7 @@ class LangChainManager:
     
     def __init__(self):
         self.llm: Optional[ChatOpenAI] = None
+        self.sql_llm: Optional[ChatOpenAI] = None
         self.memory: Optional[ConversationBufferWindowMemory] = None
         self._initialize_components()
     
@@ -57,6 +58,21 @@ class LangChainManager:
             raise RuntimeError("LLM이 초기화되지 않았습니다.")
         return self.llm
     
+    def get_sql_llm(self) -> ChatOpenAI:
+        """
+        SQL 생성용 LLM 인스턴스 반환
+        
+        대화용 LLM의 클라이언트를 공유하되, 결정적 출력(temperature=0)과 짧은
+        응답 길이로 SQL 생성 지연 시간을 줄입니다.
+        """
+        if self.sql_llm is None:
+            self.sql_llm = self.get_llm().copy(update={
+                "model_name": settings.openai_sql_model or settings.openai_model,
+                "temperature": 0,
+                "max_tokens": settings.openai_sql_max_tokens
+            })
+        return self.sql_llm
+    
     def get_memory(self) -> ConversationBufferWindowMemory:
         """메모리 인스턴스 반환"""
         if self.memory is None:
@@ -4,6 +4,7 @@ AI 데이터 분석 비서 - 메인 애플리케이션
 Gradio 기반 웹 애플리케이션의 엔트리포인트입니다.
 """
 
+import weakref
 import gradio as gr
 import structlog
 from app.config.settings import settings
@@ -19,6 +20,12 @@ from app.ui.file_interface import file_interface
 setup_logging()
 logger = structlog.get_logger()
 
+# 이벤트 핸들러가 이미 연결된 Blocks (캐시된 레이아웃에 중복 연결 방지)
+_configured_apps = weakref.WeakSet()
+
+# 자연어 SQL 질의 동시 실행 수 (전체 사용자 합계) - 같은 세션의 재질의는 핸들러에서 이전 질의를 취소
+_SQL_QUERY_CONCURRENCY = 4
+
 
 def initialize_app():
     """애플리케이션 초기화"""
@@ -43,8 +50,11 @@ def create_app() -> gr.Blocks:
     # 새로운 레이아웃 시스템 사용
     app, components = create_main_layout()
     
-    # 이벤트 핸들러 연결
-    _setup_event_handlers(components)
+    # 이벤트 핸들러 연결 (Blocks 컨텍스트 안에서만 등록 가능)
+    if app not in _configured_apps:
+        with app:
+            _setup_event_handlers(components)
+        _configured_apps.add(app)
     
     return app
 
@@ -54,26 +64,59 @@ def _setup_event_handlers(components: dict):
     
     # 채팅 관련 이벤트
     if 'send_button' in components and 'message_input' in components and 'chatbot' in components:
+        chat_inputs = [components['message_input'], components['chat_history']]
+        chat_outputs = [components['chat_history'], components['message_input']]
+        chat_view_inputs = [components['chat_history'], components['chat_offset']]
+        
+        def _update_load_more(event):
+            """대화 표시 갱신 후 '더 보기' 버튼 표시 여부 갱신"""
+            if 'load_more_button' in components:
+                event.then(
+                    fn=chat_handler.get_load_more_update,
+                    inputs=chat_view_inputs,
+                    outputs=[components['load_more_button']]
+                )
+        
         # 전송 버튼 클릭
-        components['send_button'].click(
+        _update_load_more(components['send_button'].click(
             fn=chat_handler.send_message,
-            inputs=[components['message_input'], components['chatbot']],
-            outputs=[components['chatbot'], components['message_input']]
-        )
+            inputs=chat_inputs,
+            outputs=chat_outputs
+        ).then(
+            fn=chat_handler.render_history,
+            inputs=chat_view_inputs,
+            outputs=[components['chatbot']]
+        ))
         
         # Enter 키로 전송
-        components['message_input'].submit(
+        _update_load_more(components['message_input'].submit(
             fn=chat_handler.send_message,
-            inputs=[components['message_input'], components['chatbot']],
-            outputs=[components['chatbot'], components['message_input']]
-        )
+            inputs=chat_inputs,
+            outputs=chat_outputs
+        ).then(
+            fn=chat_handler.render_history,
+            inputs=chat_view_inputs,
+            outputs=[components['chatbot']]
+        ))
         
-        # 대화 초기화
+        # 이전 대화 더 보기
+        if 'load_more_button' in components:
+            _update_load_more(components['load_more_button'].click(
+                fn=chat_handler.load_more_history,
+                inputs=chat_view_inputs,
+                outputs=[components['chatbot'], components['chat_offset']]
+            ))
+        
+        # 대화 초기화 (표시 구간도 최근 구간으로 되돌림)
         if 'clear_button' in components:
-            components['clear_button'].click(
+            _update_load_more(components['clear_button'].click(
                 fn=chat_handler.clear_chat,
-                outputs=[components['chatbot'], components['message_input']]
-            )
+                outputs=chat_outputs + [components['chat_offset']]
+            ).then(
+                fn=chat_handler.render_history,
+                inputs=chat_view_inputs,
+                outputs=[components['chatbot']]
+            ))
     
     # 파일 업로드 이벤트
     if 'file_upload' in components and 'uploaded_files_display' in components:
@@ -146,7 +189,14 @@ def _setup_event_handlers(components: dict):
                 components['result_chart'],  # chart visibility
                 components['analysis_insights'],  # insights
                 components['analysis_insights']  # insights visibility
-            ]
+            ],
+            # 재질의 시 이전 질의는 핸들러에서 취소되므로 클릭을 무시하지 않고 받되,
+            # 전체 동시 LLM 호출 수는 제한
+            trigger_mode="multiple",
+            concurrency_limit=_SQL_QUERY_CONCURRENCY
+        ).then(
+            fn=sql_interface.get_load_more_update,
+            outputs=[components['result_load_more_btn']]
         )
     
     if 'direct_sql_btn' in components:
@@ -160,6 +210,9 @@ def _setup_event_handlers(components: dict):
                 components['executed_sql'],  # visibility
                 components['result_dataframe']  # visibility
             ]
+        ).then(
+            fn=sql_interface.get_load_more_update,
+            outputs=[components['result_load_more_btn']]
         )
     
     if 'sql_clear_btn' in components:
@@ -173,6 +226,21 @@ def _setup_event_handlers(components: dict):
                 components['executed_sql'],  # visibility
                 components['result_dataframe']  # visibility
             ]
+        ).then(
+            fn=sql_interface.get_load_more_update,
+            outputs=[components['result_load_more_btn']]
+        )
+    
+    if 'result_load_more_btn' in components:
+        components['result_load_more_btn'].click(
+            fn=sql_interface.load_more_results,
+            outputs=[components['result_dataframe'], components['result_load_more_btn']]
+        )
+    
+    if 'schema_accordion' in components:
+        components['schema_accordion'].expand(
+            fn=sql_interface.get_schema_html,
+            outputs=[components['schema_display']]
         )
     
     if 'db_connection_btn' in components and 'db_status' in components:
@@ -181,19 +249,14 @@ def _setup_event_handlers(components: dict):
             outputs=[components['db_status']]
         )
     
-    # SQL 예시 질문 버튼들
-    for i in range(8):  # 8개의 예시 질문
-        btn_key = f'example_btn_{i}'
-        if btn_key in components:
-            def create_example_handler(btn_text):
-                def handler():
-                    return btn_text
-                return handler
-            
-            components[btn_key].click(
-                fn=create_example_handler(components[btn_key].value),
-                outputs=[components['sql_question']]
-            )
+    # SQL 예시 질문 버튼들 - 버튼 문구를 질문 입력창에 복사 (브라우저에서 처리, 서버 왕복 없음)
+    for btn_key in [key for key in components if key.startswith('example_btn_')]:
+        components[btn_key].click(
+            fn=None,
+            inputs=[components[btn_key]],
+            outputs=[components['sql_question']],
+            js="(question) => question"
+        )
     
     # 파일 업로드 인터페이스 이벤트
     if 'file_upload' in components:
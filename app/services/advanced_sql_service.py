@@ -411,6 +411,20 @@ class AdvancedSQLService:
     
     def generate_advanced_sql(self, question: str) -> Dict[str, Any]:
         """고급 SQL 쿼리 생성"""
+        plan, sql_components = self.build_sql(question)
+        if not plan['success']:
+            return plan
+        
+        return {**plan, **self.analyze_sql(plan, sql_components)}
+    
+    def build_sql(self, question: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        자연어 질문을 파싱하여 실행할 SQL 쿼리 조립
+        
+        최적화 분석과 설명 생성은 쿼리 실행에 필요하지 않으므로 analyze_sql로 분리되어
+        쿼리 실행과 동시에 수행할 수 있습니다. SQL 구성 요소는 결과에 싣지 않고
+        설명 생성용으로 따로 반환합니다 (실패 시 None).
+        """
         try:
             # 자연어 파싱
             parsed = self.nlp.parse_natural_language(question)
@@ -421,20 +435,11 @@ class AdvancedSQLService:
             # SQL 쿼리 조립
             sql_query = self._assemble_sql_query(sql_components)
             
-            # 쿼리 최적화 및 분석
-            optimization = self.optimizer.optimize_query(sql_query)
-            
-            # 설명 생성
-            explanation = self._generate_explanation(parsed, sql_components, optimization)
-            
             return {
                 'success': True,
                 'sql_query': sql_query,
-                'parsed_intent': parsed,
-                'optimization': optimization,
-                'explanation': explanation,
-                'complexity_score': optimization['complexity_score']
-            }
+                'parsed_intent': parsed
+            }, sql_components
             
         except Exception as e:
             logger.error("고급 SQL 생성 실패", error=str(e))
@@ -443,7 +448,21 @@ class AdvancedSQLService:
                 'error': str(e),
                 'sql_query': None,
                 'explanation': f"SQL 생성 중 오류가 발생했습니다: {str(e)}"
-            }
+            }, None
+    
+    def analyze_sql(self, plan: Dict[str, Any], sql_components: Dict[str, Any]) -> Dict[str, Any]:
+        """build_sql 결과에 대한 최적화 분석 및 설명 생성"""
+        # 쿼리 최적화 및 분석
+        optimization = self.optimizer.optimize_query(plan['sql_query'])
+        
+        # 설명 생성
+        explanation = self._generate_explanation(plan['parsed_intent'], sql_components, optimization)
+        
+        return {
+            'optimization': optimization,
+            'explanation': explanation,
+            'complexity_score': optimization['complexity_score']
+        }
     
     def _build_sql_components(self, parsed: Dict[str, Any]) -> Dict[str, Any]:
         """SQL 구성 요소 빌드"""
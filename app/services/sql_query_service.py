@@ -5,6 +5,8 @@ SQL 쿼리 서비스
 """
 
 import asyncio
+import re
+import time
 from typing import List, Dict, Any, Tuple, Optional
 from sqlalchemy import text
 from langchain_community.utilities import SQLDatabase
@@ -23,6 +25,18 @@ from app.config.settings import settings
 
 logger = structlog.get_logger()
 
+# DB 연결 테스트 성공 결과 재사용 시간 (초)
+_CONNECTION_CHECK_TTL = 30
+
+# 에이전트 응답에서 SQL 추출 패턴 (코드 블록 우선, 없으면 SELECT 문)
+_SQL_BLOCK_RE = re.compile(r'```sql\n(.*?)\n```', re.DOTALL | re.IGNORECASE)
+_SELECT_RE = re.compile(r'(SELECT.*?;?)', re.DOTALL | re.IGNORECASE)
+
+# 직접 실행을 허용하지 않는 키워드 (소문자 SQL 기준 부분 문자열 검사)
+_DANGEROUS_SQL_RE = re.compile(
+    'drop|delete|insert|update|alter|create|truncate|grant|revoke|exec|execute'
+)
+
 
 class SQLQueryService:
     """SQL 쿼리 서비스"""
@@ -32,6 +46,7 @@ class SQLQueryService:
         self.langchain_db = None
         self.sql_agent = None
         self.schema_info = DatabaseSchemaInfo()
+        self._connection_status: Optional[Tuple[float, Tuple[bool, str]]] = None
         self._initialize_sql_agent()
     
     def _initialize_sql_agent(self):
@@ -46,7 +61,7 @@ class SQLQueryService:
             # SQL 에이전트 생성
             if langchain_manager and langchain_manager.llm:
                 self.sql_agent = create_sql_agent(
-                    llm=langchain_manager.get_llm(),
+                    llm=langchain_manager.get_sql_llm(),
                     db=self.langchain_db,
                     verbose=True,
                     agent_type="openai-tools",
@@ -100,14 +115,18 @@ SQL 쿼리:
             # 고급 SQL 서비스 import (circular import 방지)
             from app.services.advanced_sql_service import advanced_sql_service
             
-            # 고급 SQL 생성
-            advanced_result = advanced_sql_service.generate_advanced_sql(question)
+            # 고급 SQL 조립
+            plan, sql_components = advanced_sql_service.build_sql(question)
             
-            if advanced_result['success']:
-                sql_query = advanced_result['sql_query']
+            if plan['success']:
+                sql_query = plan['sql_query']
                 
-                # 생성된 SQL 실행
-                execution_result = await self._execute_extracted_sql(sql_query)
+                # 생성된 SQL 실행과 최적화 분석/설명 생성은 서로 독립적이므로 동시에 수행
+                execution_result, analysis = await asyncio.gather(
+                    self._execute_extracted_sql(sql_query),
+                    asyncio.to_thread(advanced_sql_service.analyze_sql, plan, sql_components)
+                )
+                advanced_result = {**plan, **analysis}
                 
                 return {
                     'success': True,
@@ -230,29 +249,8 @@ SQL 쿼리:
             if not self._validate_sql_safety(sql_query):
                 raise ValueError("안전하지 않은 SQL 쿼리입니다. SELECT 문만 허용됩니다.")
             
-            # 쿼리 실행
-            with SessionLocal() as db:
-                result = db.execute(text(sql_query))
-                
-                # 결과를 DataFrame으로 변환
-                if result.returns_rows:
-                    columns = list(result.keys())
-                    rows = result.fetchall()
-                    
-                    df = pd.DataFrame(rows, columns=columns)
-                    
-                    # 결과 포맷팅
-                    formatted_result = {
-                        "columns": columns,
-                        "data": df.to_dict('records'),
-                        "row_count": len(df),
-                        "summary": self._generate_result_summary(df)
-                    }
-                else:
-                    formatted_result = {
-                        "message": "쿼리가 성공적으로 실행되었습니다.",
-                        "affected_rows": result.rowcount
-                    }
+            # 쿼리 실행 (블로킹 DB 호출은 별도 스레드에서 수행)
+            formatted_result = await asyncio.to_thread(self._run_extracted_sql, sql_query)
             
             execution_time = (datetime.now() - start_time).total_seconds()
             
@@ -292,16 +290,7 @@ SQL 쿼리:
             return False
         
         # 위험한 키워드 확인
-        dangerous_keywords = [
-            'drop', 'delete', 'insert', 'update', 'alter', 'create',
-            'truncate', 'grant', 'revoke', 'exec', 'execute'
-        ]
-        
-        for keyword in dangerous_keywords:
-            if keyword in sql_lower:
-                return False
-        
-        return True
+        return _DANGEROUS_SQL_RE.search(sql_lower) is None
     
     def _enhance_question_with_context(self, question: str) -> str:
         """질문에 스키마 컨텍스트 추가"""
@@ -332,20 +321,17 @@ SQL 쿼리:
             # 에이전트 결과에서 SQL 찾기
             output = result.get("output", "")
             
-            # SQL 패턴 검색
-            import re
-            sql_pattern = r'```sql\n(.*?)\n```'
-            sql_matches = re.findall(sql_pattern, output, re.DOTALL | re.IGNORECASE)
+            # SQL 패턴 검색 (첫 번째 일치만 사용)
+            sql_match = _SQL_BLOCK_RE.search(output)
             
-            if sql_matches:
-                return sql_matches[0].strip()
+            if sql_match:
+                return sql_match.group(1).strip()
             
             # 다른 패턴 시도
-            select_pattern = r'(SELECT.*?;?)'
-            select_matches = re.findall(select_pattern, output, re.DOTALL | re.IGNORECASE)
+            select_match = _SELECT_RE.search(output)
             
-            if select_matches:
-                return select_matches[0].strip()
+            if select_match:
+                return select_match.group(1).strip()
             
             return "SQL 추출 실패"
         except Exception as e:
@@ -353,32 +339,36 @@ SQL 쿼리:
             return "SQL 추출 오류"
     
     async def _execute_extracted_sql(self, sql_query: str) -> Dict[str, Any]:
-        """추출된 SQL 쿼리 실행"""
+        """추출된 SQL 쿼리 실행 (블로킹 DB 호출은 별도 스레드에서 수행)"""
         try:
-            with SessionLocal() as db:
-                result = db.execute(text(sql_query))
-                
-                if result.returns_rows:
-                    columns = list(result.keys())
-                    rows = result.fetchall()
-                    
-                    df = pd.DataFrame(rows, columns=columns)
-                    
-                    return {
-                        "columns": columns,
-                        "data": df.to_dict('records'),
-                        "row_count": len(df),
-                        "summary": self._generate_result_summary(df)
-                    }
-                else:
-                    return {
-                        "message": "쿼리가 성공적으로 실행되었습니다.",
-                        "affected_rows": result.rowcount
-                    }
+            return await asyncio.to_thread(self._run_extracted_sql, sql_query)
         except Exception as e:
             logger.error("SQL 실행 오류", error=str(e))
             return {"error": f"SQL 실행 오류: {str(e)}"}
     
+    def _run_extracted_sql(self, sql_query: str) -> Dict[str, Any]:
+        """추출된 SQL 쿼리를 동기적으로 실행"""
+        with SessionLocal() as db:
+            result = db.execute(text(sql_query))
+            
+            if result.returns_rows:
+                columns = list(result.keys())
+                rows = result.fetchall()
+                
+                df = pd.DataFrame(rows, columns=columns)
+                
+                return {
+                    "columns": columns,
+                    "data": df.to_dict('records'),
+                    "row_count": len(df),
+                    "summary": self._generate_result_summary(df)
+                }
+            else:
+                return {
+                    "message": "쿼리가 성공적으로 실행되었습니다.",
+                    "affected_rows": result.rowcount
+                }
+    
     def _format_sample_queries(self) -> str:
         """샘플 쿼리를 문자열로 포맷팅"""
         samples = self.schema_info.get_sample_queries()
@@ -490,6 +480,22 @@ SQL 쿼리:
             logger.error("데이터베이스 연결 테스트 실패", error=str(e))
             return False, f"❌ 데이터베이스 연결 실패: {str(e)}"
 
+    
+    async def test_database_connection_async(self) -> Tuple[bool, str]:
+        """
+        데이터베이스 연결 테스트 (비동기)
+        
+        동기 점검을 스레드에서 실행해 이벤트 루프를 막지 않고,
+        성공 결과는 잠시 캐시하여 반복 클릭 시 연결 점검을 생략합니다.
+        """
+        if self._connection_status is not None:
+            checked_at, status = self._connection_status
+            if time.monotonic() - checked_at < _CONNECTION_CHECK_TTL:
+                return status
+        
+        status = await asyncio.to_thread(self.test_database_connection)
+        self._connection_status = (time.monotonic(), status) if status[0] else None
+        return status
 
 # 전역 SQL 쿼리 서비스 인스턴스
 sql_query_service = SQLQueryService()
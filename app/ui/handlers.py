@@ -6,16 +6,31 @@ Gradio 컴포넌트의 이벤트 처리를 담당합니다.
 
 import gradio as gr
 from typing import List, Tuple, Any, Optional
+import functools
+import html
 import random
 import time
 import structlog
 import asyncio
 from datetime import datetime
+from markdown_it import MarkdownIt
 from app.ui.interactions import notification_manager, progress_tracker, animation_effects
 from app.services.ai_chat_service import ai_chat_service
 
 logger = structlog.get_logger()
 
+# 챗봇에 한 번에 전송하는 최근 메시지 수
+_CHAT_WINDOW = 30
+
+# 채팅 메시지 렌더러 (원시 HTML은 이스케이프)
+_markdown = MarkdownIt("commonmark", {"html": False, "breaks": True}).enable("table")
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_md(text: str) -> str:
+    """마크다운을 HTML로 변환 (메시지 내용 기준 캐시)"""
+    return _markdown.render(text)
+
 
 class ChatHandler:
     """채팅 인터페이스 이벤트 핸들러"""
@@ -78,7 +93,25 @@ class ChatHandler:
         
         return history, ""
     
-    def clear_chat(self) -> Tuple[List, str]:
+    def render_history(self, history: List[Tuple[str, str]], offset: int = 0) -> List[Tuple[str, str]]:
+        """채팅 히스토리의 최근 구간만 화면 표시용 HTML로 변환"""
+        visible = (history or [])[-(_CHAT_WINDOW + offset):]
+        return [
+            (_render_md(user_msg), _render_md(ai_msg) if ai_msg else ai_msg)
+            for user_msg, ai_msg in visible
+        ]
+    
+    def load_more_history(self, history: List[Tuple[str, str]], offset: int) -> Tuple[List[Tuple[str, str]], int]:
+        """이전 대화를 한 구간 더 불러오기"""
+        hidden = max(len(history or []) - _CHAT_WINDOW, 0)
+        offset = min(offset + _CHAT_WINDOW, hidden)
+        return self.render_history(history, offset), offset
+    
+    def get_load_more_update(self, history: List[Tuple[str, str]], offset: int = 0) -> Any:
+        """표시 구간 밖에 이전 대화가 남아 있을 때만 '더 보기' 버튼 표시"""
+        return gr.update(visible=len(history or []) > _CHAT_WINDOW + offset)
+    
+    def clear_chat(self) -> Tuple[List, str, int]:
         """채팅 초기화"""
         self.conversation_history.clear()
         
@@ -90,7 +123,7 @@ class ChatHandler:
             logger.warning("AI 서비스 초기화 실패", error=str(e))
         
         logger.info("채팅 히스토리 초기화")
-        return [], ""
+        return [], "", 0  # 기록, 입력창, 표시 구간 오프셋
     
     def _generate_demo_response(self, message: str) -> str:
         """데모 응답 생성"""
@@ -191,7 +224,7 @@ class FileHandler:
                 font-size: 12px;
             ">
                 <div>
-                    <div style="font-weight: 600;">📊 {file['name']}</div>
+                    <div style="font-weight: 600;">{self._format_file_icon(file)} {file['name']}</div>
                     <div style="color: #666; font-size: 11px;">
                         {self._format_file_size(file.get('size', 0))} • 
                         {self._format_time(file['upload_time'])}
@@ -212,6 +245,16 @@ class FileHandler:
         files_html += "</div>"
         return files_html
     
+    def _format_file_icon(self, file: dict) -> str:
+        """파일 아이콘 HTML 생성 (미리보기 이미지는 지연 로딩)"""
+        thumbnail = file.get('thumbnail')
+        if thumbnail:
+            return (
+                f'<img src="{html.escape(thumbnail, quote=True)}" loading="lazy" decoding="async" fetchpriority="low" '
+                f'width="32" height="32" alt="">'
+            )
+        return '<span aria-hidden="true">📊</span>'
+    
     def _format_file_size(self, size: int) -> str:
         """파일 크기 포맷팅"""
         if size < 1024:
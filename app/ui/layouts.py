@@ -4,224 +4,411 @@ Gradio UI 레이아웃 정의
 와이어프레임을 기반으로 한 UI 레이아웃 구성
 """
 
-import gradio as gr
-from typing import Tuple, Dict, Any
+import functools
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, Dict, Any
 from app.config.settings import settings
-from app.ui.components import create_header
-from app.ui.interactions import quick_actions, keyboard_shortcuts
-from app.ui.themes import theme_manager, animation_css
-from app.ui.responsive import responsive_design, accessibility_features, device_detection
-from app.ui.ai_status import ai_status_panel, ai_settings_panel, conversation_analytics
-from app.ui.user_guide import user_guide, tutorial_creator
-from app.ui.sql_interface import sql_interface
-from app.ui.file_interface import file_interface
+from app.utils.css_utils import minify_css, merge_media_queries
 
+if TYPE_CHECKING:
+    import gradio as gr
 
-def create_main_layout() -> Tuple[gr.Blocks, Dict[str, Any]]:
+
+@functools.lru_cache(maxsize=1)
+def _gr():
+    """gradio 모듈 지연 로딩 (레이아웃을 실제로 만들 때만 import)"""
+    import gradio
+    return gradio
+
+
+# 정적 자산 디렉토리 (Gradio 정적 경로로 등록되어 ETag 기반 브라우저 캐시 적용)
+_STATIC_DIR = (Path(__file__).parent / "static").resolve()
+_LAYOUT_CSS_PATH = _STATIC_DIR / "layouts.css"
+
+
+def _file_route_prefix() -> str:
+    """설치된 Gradio 버전의 파일 라우트 접두사 (5.x부터 API 경로가 gradio_api/ 아래로 이동)"""
+    try:
+        major = int(version("gradio").split(".")[0])
+    except (PackageNotFoundError, ValueError):
+        major = 0
+    return "gradio_api/file=" if major >= 5 else "file="
+
+
+# 파일 라우트 접두사 - gradio를 import하지 않고 패키지 메타데이터로 한 번만 판별
+_FILE_ROUTE_PREFIX = _file_route_prefix()
+
+
+def _build_static_url(path: Path) -> str:
     """
-    메인 레이아웃 생성
+    정적 파일 URL 생성 (내용 해시를 버전 쿼리로 붙여 파일 변경 시 캐시 무효화)
     
-    와이어프레임 기반의 실제 UI 구현:
-    - 헤더 (브랜딩)
-    - 채팅 영역 (중앙 상단)
-    - 입력 영역 (중앙 하단) 
-    - 파일 업로드 (좌측 하단)
-    - 설정 패널 (우측 하단)
+    file= 경로는 서버 작업 디렉토리와 무관하게 해석되도록 절대 경로를 쓰고(정적 경로 등록으로 허용),
+    URL 자체는 상대 경로로 두어 root_path(프록시 하위 경로) 아래에서도 올바른 주소로 요청되게 합니다.
     """
+    path = path.resolve()
+    digest = hashlib.md5(path.read_bytes()).hexdigest()[:10]
+    return f"{_FILE_ROUTE_PREFIX}{path.as_posix()}?v={digest}"
+
+
+# 정적 파일별 URL - 내용 해시는 모듈 로드 시 파일마다 한 번만 계산
+_STATIC_URLS = {path: _build_static_url(path) for path in _STATIC_DIR.rglob("*") if path.is_file()}
+
+
+def _static_url(path: Path) -> str:
+    """정적 파일 URL 조회 (정적 디렉토리 밖의 파일은 그때 생성)"""
+    return _STATIC_URLS.get(path) or _build_static_url(path)
+
+
+# 공용 컨테이너 클래스 (여러 섹션에서 같은 튜플을 공유)
+_CLS_MAIN_CONTENT = ("main-content",)
+_CLS_SIDEBAR_PANEL = ("sidebar-panel",)
+_CLS_PANEL_CONTENT = ("panel-content",)
+
+# 패널 헤더 마크업 (고정 문자열)
+_PANEL_HEADER_CHAT = '<div class="panel-header">💬 AI 데이터 분석 대화</div>'
+_PANEL_HEADER_UPLOAD = '<div class="panel-header">📁 파일 업로드</div>'
+_PANEL_HEADER_SETTINGS = '<div class="panel-header">⚙️ 설정</div>'
+
+# 시스템 상태 기본값 - {항목: (상태 텍스트, 표시 등급)}
+_DEFAULT_SYSTEM_STATUS = {
+    "웹 서버": ("정상 동작", "connected"),
+    "데이터베이스": ("연결됨", "connected"),
+    "AI 엔진": ("준비 중 (Week 2)", "warning"),
+    "캐시": ("활성화", "connected"),
+}
+
+# 업로드 영역 안내 마크업
+_UPLOAD_AREA_HTML = """
+<div class="upload-area">
+    <div class="upload-icon"><span aria-hidden="true">📂</span></div>
+    <div class="upload-title">
+        파일을 드래그하거나 클릭하여 업로드
+    </div>
+    <div class="upload-desc">
+        Excel (.xlsx, .xls), CSV 파일 지원<br>
+        최대 100MB
+    </div>
+</div>
+"""
+
+# 푸터 마크업 (앱 이름/버전은 프로세스 내에서 고정)
+_FOOTER_HTML = f"""
+<div class="footer">
+    <div class="footer-brand">
+        <div class="footer-name">
+            🤖 <strong>{settings.app_name}</strong>
+        </div>
+        <div class="footer-divider">|</div>
+        <div class="footer-version">
+            v{settings.app_version}
+        </div>
+    </div>
+    <div class="footer-progress">
+        <strong>Week 1:</strong> UI 기본 구성 완료 | 
+        <strong>다음:</strong> Week 2 AI 연동 예정
+    </div>
+    <div class="footer-tagline">
+        <em>"데이터의 힘을 모든 사람에게"</em> 🌟
+    </div>
+</div>
+"""
+
+
+def _build_section_specs() -> Dict[str, Tuple[Tuple[Optional[str], str, Dict[str, Any]], ...]]:
+    """
+    섹션별 컴포넌트 스펙 테이블 생성 - (키, 컴포넌트 클래스명, 생성 인자)
     
-    # 커스텀 CSS (와이어프레임 기반 + 테마 + 애니메이션 + 반응형 + 접근성)
-    custom_css = f"""
-    {animation_css.get_animations()}
-    {responsive_design.get_responsive_css()}
-    {accessibility_features.get_accessibility_css()}
-    
-    /* 전체 컨테이너 */
-    .gradio-container {{
-        max-width: 1200px !important;
-        margin: 0 auto;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    }}
-    
-    /* 헤더 스타일링 */
-    .header-container {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 12px;
-        margin-bottom: 20px;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* 채팅 영역 */
-    .chat-container {
-        border: 2px solid #e3f2fd;
-        border-radius: 12px;
-        background: #fafafa;
-        margin-bottom: 15px;
-    }
-    
-    .gr-chatbot {
-        border: none !important;
-        background: white !important;
-        border-radius: 8px !important;
-    }
-    
-    /* 입력 영역 */
-    .input-container {
-        background: white;
-        padding: 15px;
-        border: 1px solid #e0e0e0;
-        border-radius: 12px;
-        margin-bottom: 20px;
-    }
-    
-    .gr-textbox {
-        border: 2px solid #e0e0e0 !important;
-        border-radius: 8px !important;
-        font-size: 14px !important;
-    }
-    
-    .gr-textbox:focus {
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-    }
-    
-    /* 버튼 스타일링 */
-    .gr-button-primary {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border: none !important;
-        color: white !important;
-        font-weight: 600 !important;
-        border-radius: 8px !important;
-        padding: 10px 20px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .gr-button-primary:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4) !important;
-    }
-    
-    .gr-button-secondary {
-        background: #f8f9fa !important;
-        border: 2px solid #e0e0e0 !important;
-        color: #495057 !important;
-        font-weight: 600 !important;
-        border-radius: 8px !important;
-    }
-    
-    .gr-button-secondary:hover {
-        background: #e9ecef !important;
-        border-color: #ced4da !important;
-    }
-    
-    /* 사이드바 패널 */
-    .sidebar-panel {
-        background: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 12px;
-        padding: 0;
-        margin-bottom: 15px;
-    }
-    
-    .panel-header {
-        background: #f8f9fa;
-        padding: 15px;
-        border-bottom: 1px solid #e0e0e0;
-        border-radius: 12px 12px 0 0;
-        font-weight: 600;
-        color: #495057;
-    }
-    
-    .panel-content {
-        padding: 15px;
-    }
-    
-    /* 파일 업로드 영역 */
-    .upload-area {
-        border: 2px dashed #FF9800;
-        border-radius: 12px;
-        background: #fff8e1;
-        padding: 30px;
-        text-align: center;
-        transition: all 0.3s ease;
-        cursor: pointer;
-    }
-    
-    .upload-area:hover {
-        border-color: #F57C00;
-        background: #fff3e0;
-    }
-    
-    .upload-area.dragover {
-        border-color: #E65100;
-        background: #ffecb3;
-        transform: scale(1.02);
-    }
-    
-    /* 설정 패널 */
-    .settings-panel {
-        background: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 12px;
-    }
-    
-    .setting-item {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 10px 0;
-        border-bottom: 1px solid #f0f0f0;
-    }
-    
-    .setting-item:last-child {
-        border-bottom: none;
+    키가 None인 항목은 생성만 하고 components에는 등록하지 않습니다 (헤더 등 정적 마크업).
+    """
+    return {
+        # 채팅 영역
+        'chat': (
+            (None, 'HTML', dict(value=_PANEL_HEADER_CHAT, show_label=False, elem_id="panel-header-chat")),
+            ('chatbot', 'Chatbot', dict(
+                label="",
+                height=450,
+                placeholder="AI와 대화를 시작해보세요! 곧 실제 분석 기능이 추가됩니다.",
+                show_label=False,
+                container=False,
+                elem_classes="main-chatbot",
+                bubble_full_width=False,
+                # 챗봇 메시지는 렌더링된 HTML이라 복사 시 마크업이 복사되므로 복사 버튼은 끔
+                show_copy_button=False,
+                # 마크다운은 서버에서 한 번만 렌더링 (handlers._render_md)
+                render_markdown=False,
+                sanitize_html=False
+            )),
+            # 원본(마크다운) 대화 기록 - 챗봇에는 렌더링된 HTML만 표시
+            ('chat_history', 'State', dict(value=[])),
+            # 챗봇에는 최근 구간만 전송하고, 이전 대화는 요청 시 추가로 불러옴
+            ('chat_offset', 'State', dict(value=0)),
+            ('load_more_button', 'Button', dict(
+                value="⬆️ 이전 대화 더 보기",
+                variant="secondary",
+                size="sm",
+                elem_classes="load-more-button",
+                # 가려진 이전 대화가 생기면 표시 (ChatHandler.get_load_more_update)
+                visible=False
+            )),
+        ),
+        # 입력창
+        'input': (
+            ('message_input', 'Textbox', dict(
+                label="채팅 입력",  # 화면에는 숨기고 보조기기용 이름으로만 사용
+                placeholder="자연어로 질문해보세요. 예: '지난 달 매출 현황을 보여주세요'",
+                lines=2,
+                max_lines=5,
+                show_label=False,
+                container=False,
+                scale=4,
+                min_width=0,
+                elem_classes="message-input"
+            )),
+        ),
+        # 전송/초기화 버튼
+        'input_buttons': (
+            ('send_button', 'Button', dict(
+                value="💬 전송",
+                variant="primary",
+                elem_classes="send-button"
+            )),
+            ('clear_button', 'Button', dict(
+                value="🗑️ 초기화",
+                variant="secondary",
+                size="sm",
+                elem_classes="clear-button"
+            )),
+        ),
+        # 파일 업로드
+        'file_upload': (
+            ('file_upload', 'File', dict(
+                label="파일 업로드",  # 화면에는 숨기고 보조기기용 이름으로만 사용
+                file_types=[".xlsx", ".xls", ".csv"],
+                file_count="multiple",
+                show_label=False,
+                container=False,
+                elem_classes="file-upload"
+            )),
+            (None, 'HTML', dict(value=_UPLOAD_AREA_HTML)),
+        ),
+        # 패널 헤더
+        'upload_header': (
+            (None, 'HTML', dict(value=_PANEL_HEADER_UPLOAD, show_label=False, elem_id="panel-header-upload")),
+        ),
+        'settings_header': (
+            (None, 'HTML', dict(value=_PANEL_HEADER_SETTINGS, show_label=False, elem_id="panel-header-settings")),
+        ),
+        # 업로드된 파일 목록
+        'uploaded_files': (
+            ('uploaded_files_display', 'HTML', dict(
+                value="""
+                <div id="uploaded-files" style="margin-top: 15px;">
+                    <div style="font-size: 14px; font-weight: 600; margin-bottom: 10px;">업로드된 파일:</div>
+                    <div style="font-size: 12px; color: #666; font-style: italic;">
+                        아직 업로드된 파일이 없습니다.
+                    </div>
+                </div>
+                """
+            )),
+        ),
+        # 데이터베이스 연결 설정
+        'db_connection': (
+            ('db_type', 'Dropdown', dict(
+                choices=["PostgreSQL", "MySQL", "SQLite"],
+                value="PostgreSQL",
+                label="데이터베이스 타입",
+                interactive=True
+            )),
+            ('db_host', 'Textbox', dict(
+                label="호스트",
+                placeholder="localhost",
+                value="localhost"
+            )),
+            ('db_port', 'Number', dict(
+                label="포트",
+                value=5432,
+                precision=0
+            )),
+            ('db_name', 'Textbox', dict(
+                label="데이터베이스명",
+                placeholder="database_name"
+            )),
+            ('db_test_button', 'Button', dict(
+                value="🔌 연결 테스트",
+                variant="secondary",
+                size="sm"
+            )),
+        ),
+        # 애플리케이션 설정
+        'app_settings': (
+            ('language_select', 'Dropdown', dict(
+                choices=["한국어", "English"],
+                value="한국어",
+                label="언어 설정"
+            )),
+            ('theme_select', 'Dropdown', dict(
+                choices=["라이트", "다크", "자동"],
+                value="라이트",
+                label="테마 설정"
+            )),
+            ('chart_default', 'Dropdown', dict(
+                choices=["자동 선택", "막대 차트", "선 차트", "파이 차트"],
+                value="자동 선택",
+                label="기본 차트 타입"
+            )),
+        ),
+        # 시스템 상태 (표시는 gr.render로 상태 값이 바뀔 때만 다시 그림)
+        'system_status': (
+            ('system_status', 'State', dict(value=_DEFAULT_SYSTEM_STATUS)),
+        ),
     }
+
+
+# 섹션별 컴포넌트 스펙 (순수 데이터, import 시 한 번만 생성)
+_SECTION_SPECS = _build_section_specs()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_custom_css() -> str:
+    """
+    인라인 CSS 생성 (애니메이션 + 첫 화면에 필요한 반응형/접근성 규칙)
     
-    /* 상태 표시 */
-    .status-indicator {
-        display: inline-block;
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        margin-right: 8px;
-    }
+    입력이 모두 프로세스 내에서 고정된 문자열이므로 최초 호출 시 한 번만 조합 및 압축하고,
+    모듈별로 중복된 @media 블록을 하나로 병합합니다.
+    레이아웃 고유 스타일(static/layouts.css), 미디어별 반응형 스타일(static/responsive/),
+    지연 로드 접근성 스타일은 <link>로 로드됩니다.
+    """
+    from app.ui.themes import animation_css
+    from app.ui.responsive import responsive_design, accessibility_features
     
-    .status-connected {
-        background: #28a745;
-        box-shadow: 0 0 8px rgba(40, 167, 69, 0.4);
-    }
+    return merge_media_queries(minify_css(f"""
+    {animation_css.get_animations()}
+    {responsive_design.get_critical_css()}
+    {accessibility_features.get_critical_css()}
+    """))
+
+
+# 선호도 시트 로더 - matchMedia가 일치할 때 <link>를 추가하고, media 속성은 유지해
+# 선호도가 다시 바뀌면 규칙 적용도 자동으로 해제됨
+_PREFERENCE_LOADER_SCRIPT = """<script>
+(function() {
+    __SHEETS__.forEach(function(sheet) {
+        const query = window.matchMedia(sheet[0]);
+        function load() {
+            if (!query.matches) {
+                return;
+            }
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.media = sheet[0];
+            link.href = sheet[1];
+            document.head.appendChild(link);
+            query.removeEventListener('change', load);
+        }
+        query.addEventListener('change', load);
+        load();
+    });
+})();
+</script>"""
+
+
+@functools.lru_cache(maxsize=1)
+def _build_deferred_links() -> str:
+    """
+    비핵심 스타일시트 <link> 태그 생성
     
-    .status-disconnected {
-        background: #dc3545;
-        box-shadow: 0 0 8px rgba(220, 53, 69, 0.4);
-    }
+    미디어별 반응형 시트는 media 속성으로 맞지 않는 화면에서 렌더링을 막지 않고,
+    선호도 시트는 해당 미디어 쿼리가 일치할 때(또는 나중에 일치하게 될 때)만 받으며,
+    접근성 지연 시트는 preload로 받아 로드가 끝나면 적용합니다.
+    """
+    from app.ui.responsive import responsive_design, accessibility_features
+    
+    links = [
+        f'<link rel="stylesheet" href="{_static_url(path)}" media="{media}">'
+        for path, media in responsive_design.get_media_stylesheets()
+    ]
+    preference_sheets = json.dumps([
+        [media, _static_url(path)] for path, media in responsive_design.get_preference_stylesheets()
+    ])
+    links.append(_PREFERENCE_LOADER_SCRIPT.replace("__SHEETS__", preference_sheets))
+    deferred_url = _static_url(accessibility_features.get_deferred_stylesheet())
+    links.append(
+        f'<link rel="preload" as="style" href="{deferred_url}" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        f'<noscript><link rel="stylesheet" href="{deferred_url}"></noscript>'
+    )
+    return "\n".join(links)
+
+
+def _materialize(components: Dict[str, Any], section: str) -> None:
+    """스펙 테이블의 컴포넌트를 한 번에 생성하여 components에 등록"""
+    gr = _gr()
+    for key, factory, kwargs in _SECTION_SPECS[section]:
+        component = getattr(gr, factory)(**kwargs)
+        if key is not None:
+            components[key] = component
+
+
+def create_main_layout() -> Tuple["gr.Blocks", Dict[str, Any]]:
+    """
+    메인 레이아웃 생성 (프로세스 내 캐시)
     
-    .status-warning {
-        background: #ffc107;
-        box-shadow: 0 0 8px rgba(255, 193, 7, 0.4);
-    }
+    같은 설정으로 다시 호출되면 이미 조립된 Blocks를 그대로 반환합니다.
+    reload_mode가 켜져 있으면 캐시를 사용하지 않고 매번 새로 생성합니다.
+    캐시는 clear_layout_cache()로 비울 수 있습니다.
+    """
+    if settings.reload_mode:
+        return _build_main_layout()
+    return _cached_main_layout(
+        settings.app_name, settings.app_version, settings.default_theme, settings.ui_mode
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_main_layout(app_name: str, app_version: str, default_theme: str, ui_mode: str) -> Tuple["gr.Blocks", Dict[str, Any]]:
+    """레이아웃에 영향을 주는 설정 값을 키로 캐시된 메인 레이아웃"""
+    return _build_main_layout()
+
+
+def clear_layout_cache() -> None:
+    """캐시된 메인 레이아웃 제거 (다음 create_main_layout 호출 시 새로 생성)"""
+    _cached_main_layout.cache_clear()
+
+
+def _build_main_layout() -> Tuple["gr.Blocks", Dict[str, Any]]:
+    """
+    메인 레이아웃 생성
     
-    /* 반응형 디자인 */
-    @media (max-width: 768px) {
-        .gradio-container {
-            padding: 10px;
-        }
-        
-        .gr-row {
-            flex-direction: column !important;
-        }
-        
-        .sidebar-panel {
-            margin-top: 20px;
-        }
-    }
+    와이어프레임 기반의 실제 UI 구현:
+    - 헤더 (브랜딩)
+    - 채팅 영역 (중앙 상단)
+    - 입력 영역 (중앙 하단) 
+    - 파일 업로드 (좌측 하단)
+    - 설정 패널 (우측 하단)
     """
+    gr = _gr()
+    from app.ui.components import create_header
+    from app.ui.interactions import keyboard_shortcuts
+    from app.ui.themes import theme_manager
+    from app.ui.responsive import accessibility_features, device_detection
+    from app.ui.ai_status import ai_status_panel, conversation_analytics
+    from app.ui.user_guide import user_guide, tutorial_creator
+    from app.ui.sql_interface import sql_interface
+    from app.ui.file_interface import file_interface
     
     components = {}
+    full_ui = settings.ui_mode != "lite"
+    
+    # 정적 CSS/JS 파일을 복사 없이 직접 서빙
+    gr.set_static_paths(paths=[_STATIC_DIR])
     
     with gr.Blocks(
         title=settings.app_name,
         theme=theme_manager.get_theme(settings.default_theme),
-        css=custom_css,
+        css=_build_custom_css(),
         head=f"""
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="AI 데이터 분석 비서 - 자연어로 묻고, AI가 분석하고, 시각화로 답하다">
@@ -229,7 +416,9 @@ def create_main_layout() -> Tuple[gr.Blocks, Dict[str, Any]]:
         <meta name="apple-mobile-web-app-capable" content="yes">
         <meta name="apple-mobile-web-app-status-bar-style" content="default">
         <meta name="apple-mobile-web-app-title" content="{settings.app_name}">
-        {device_detection.get_device_optimization_script()}
+        <link rel="stylesheet" href="{_static_url(_LAYOUT_CSS_PATH)}">
+        {_build_deferred_links()}
+        <script src="{_static_url(device_detection.get_device_script_path())}" defer></script>
         """
     ) as app:
         
@@ -240,15 +429,15 @@ def create_main_layout() -> Tuple[gr.Blocks, Dict[str, Any]]:
         components['header'] = create_header()
         
         # 메인 컨텐츠 영역 (접근성 식별자 추가)
-        with gr.Row(elem_classes="main-content"):
+        with gr.Row(elem_classes=_CLS_MAIN_CONTENT):
             # 왼쪽: 메인 기능 영역 (2/3)
             with gr.Column(scale=2, elem_classes="main-function-column"):
                 # 메인 기능 탭
                 with gr.Tabs():
                     # AI 채팅 탭 (기존)
                     with gr.Tab("💬 AI 채팅"):
-                        components.update(_create_chat_section())
-                        components.update(_create_input_section())
+                        _create_chat_section(components)
+                        _create_input_section(components)
                     
                     # SQL 질의 탭
                     sql_components = sql_interface.create_sql_interface()
@@ -264,39 +453,42 @@ def create_main_layout() -> Tuple[gr.Blocks, Dict[str, Any]]:
                 components['ai_status'] = ai_status_panel.create_status_display()
                 
                 # 기존 섹션들
-                components.update(_create_file_upload_section())
-                components.update(_create_settings_section())
+                _create_file_upload_section(components)
+                _create_settings_section(components)
                 
-                # 대화 분석 패널
-                components['conversation_analytics'] = conversation_analytics.create_analytics_panel()
+                # 대화 분석 패널 (lite 모드에서는 고급 패널로 이동)
+                if full_ui:
+                    components['conversation_analytics'] = conversation_analytics.create_analytics_panel()
+        
+        # 사용자 가이드 및 도움말 (각 탭 본문은 처음 보일 때 생성)
+        lazy_tabs = {
+            "✨ 기능 소개": user_guide.create_feature_overview,
+            "💡 사용 팁": user_guide.create_tips_and_tricks,
+            "💬 예시 대화": user_guide.create_example_conversations,
+            "🔧 문제 해결": user_guide.create_troubleshooting_guide,
+        }
+        if full_ui:
+            lazy_tabs["🎓 튜토리얼"] = tutorial_creator.create_interactive_tutorial
         
-        # 사용자 가이드 및 도움말
-        with gr.Accordion("📚 사용자 가이드", open=False):
+        with gr.Accordion("📚 사용자 가이드", open=False, elem_classes="guide-accordion-content") as guide_accordion:
             with gr.Tabs():
+                # 기본 탭은 아코디언이 처음 펼쳐질 때 생성
                 with gr.Tab("🚀 빠른 시작"):
-                    user_guide.create_welcome_guide()
-                    user_guide.create_quick_start_guide()
-                
-                with gr.Tab("✨ 기능 소개"):
-                    user_guide.create_feature_overview()
-                
-                with gr.Tab("💡 사용 팁"):
-                    user_guide.create_tips_and_tricks()
+                    _lazy_mount(guide_accordion.expand, _create_quick_start_guide)
                 
-                with gr.Tab("💬 예시 대화"):
-                    user_guide.create_example_conversations()
-                
-                with gr.Tab("🔧 문제 해결"):
-                    user_guide.create_troubleshooting_guide()
-                
-                with gr.Tab("🎓 튜토리얼"):
-                    tutorial_creator.create_interactive_tutorial()
+                for label, builder in lazy_tabs.items():
+                    _create_lazy_tab(label, builder)
         
-        # 키보드 단축키 가이드
-        keyboard_shortcuts.create_shortcuts_guide()
-        
-        # 접근성 컨트롤 패널
-        accessibility_features.create_accessibility_controls()
+        if full_ui:
+            # 키보드 단축키 가이드
+            keyboard_shortcuts.create_shortcuts_guide()
+            
+            # 접근성 컨트롤 패널
+            accessibility_features.create_accessibility_controls()
+        else:
+            # lite 모드: 부가 패널은 버튼을 누를 때 한 번만 생성
+            advanced_button = gr.Button("🧩 고급 패널 불러오기", variant="secondary", size="sm")
+            _lazy_mount(advanced_button.click, _create_advanced_panels)
         
         # 푸터
         components['footer'] = _create_footer()
@@ -304,243 +496,135 @@ def create_main_layout() -> Tuple[gr.Blocks, Dict[str, Any]]:
     return app, components
 
 
-def _create_chat_section() -> Dict[str, Any]:
+def _format_system_status(status: Dict[str, Tuple[str, str]]) -> str:
+    """시스템 상태 패널 HTML 생성"""
+    rows = "".join(
+        f'<div><span class="status-indicator status-{level}"></span><strong>{name}:</strong> {text}</div>'
+        for name, (text, level) in status.items()
+    )
+    return (
+        '<div class="status-panel"><div class="status-title">🔌 시스템 상태</div>'
+        f'<div class="status-rows">{rows}</div></div>'
+    )
+
+
+def _mark_mounted(mounted: bool) -> bool:
+    """지연 탭 마운트 플래그 설정 (이미 마운트된 경우 그대로 유지)"""
+    return True
+
+
+def _lazy_mount(trigger: Callable[..., Any], builder: Callable[[], Any]) -> None:
+    """trigger 이벤트가 처음 발생할 때 builder로 컴포넌트를 생성 (gr.render 기반)"""
+    gr = _gr()
+    mounted = gr.State(False)
+    
+    @gr.render(inputs=[mounted])
+    def _render_body(is_mounted):
+        if is_mounted:
+            builder()
+    
+    trigger(_mark_mounted, inputs=[mounted], outputs=[mounted], show_progress="hidden", api_name=False)
+
+
+def _create_lazy_tab(label: str, builder: Callable[[], Any]) -> None:
+    """탭이 처음 선택될 때 builder로 본문을 생성하는 지연 탭 생성"""
+    gr = _gr()
+    
+    with gr.Tab(label) as tab:
+        _lazy_mount(tab.select, builder)
+
+
+def _create_quick_start_guide() -> None:
+    """사용자 가이드 기본 탭 본문 생성"""
+    from app.ui.user_guide import user_guide
+    
+    user_guide.create_welcome_guide()
+    user_guide.create_quick_start_guide()
+
+
+def _create_advanced_panels() -> None:
+    """고급 패널 생성 (lite 모드에서 요청 시 호출)"""
+    from app.ui.interactions import keyboard_shortcuts
+    from app.ui.responsive import accessibility_features
+    from app.ui.ai_status import conversation_analytics
+    from app.ui.user_guide import tutorial_creator
+    
+    conversation_analytics.create_analytics_panel()
+    tutorial_creator.create_interactive_tutorial()
+    keyboard_shortcuts.create_shortcuts_guide()
+    accessibility_features.create_accessibility_controls()
+
+
+def _create_chat_section(components: Dict[str, Any]) -> None:
     """채팅 섹션 생성"""
-    components = {}
+    gr = _gr()
     
     with gr.Group(elem_classes="chat-container"):
-        gr.HTML("""
-        <div class="panel-header">
-            💬 AI 데이터 분석 대화
-        </div>
-        """)
-        
-        components['chatbot'] = gr.Chatbot(
-            label="",
-            height=450,
-            placeholder="AI와 대화를 시작해보세요! 곧 실제 분석 기능이 추가됩니다.",
-            show_label=False,
-            container=False,
-            elem_classes="main-chatbot",
-            bubble_full_width=False,
-            show_copy_button=True
-        )
-    
-    return components
+        _materialize(components, 'chat')
 
 
-def _create_input_section() -> Dict[str, Any]:
+def _create_input_section(components: Dict[str, Any]) -> None:
     """입력 섹션 생성"""
-    components = {}
+    gr = _gr()
+    from app.ui.interactions import quick_actions
     
     with gr.Group(elem_classes="input-container"):
         with gr.Row():
-            components['message_input'] = gr.Textbox(
-                label="",
-                placeholder="자연어로 질문해보세요. 예: '지난 달 매출 현황을 보여주세요'",
-                lines=2,
-                max_lines=5,
-                show_label=False,
-                container=False,
-                scale=4,
-                elem_classes="message-input",
-                elem_id="chat-input"  # 접근성을 위한 ID 추가
-            )
+            _materialize(components, 'input')
             
             with gr.Column(scale=1, min_width=120):
-                components['send_button'] = gr.Button(
-                    "💬 전송",
-                    variant="primary",
-                    scale=1,
-                    elem_classes="send-button"
-                )
-                components['clear_button'] = gr.Button(
-                    "🗑️ 초기화", 
-                    variant="secondary",
-                    scale=1,
-                    elem_classes="clear-button"
-                )
+                _materialize(components, 'input_buttons')
         
         # 빠른 예시 질문들
         quick_actions.create_example_buttons()
-    
-    return components
 
 
-def _create_file_upload_section() -> Dict[str, Any]:
+def _create_file_upload_section(components: Dict[str, Any]) -> None:
     """파일 업로드 섹션 생성"""
-    components = {}
+    gr = _gr()
+    from app.ui.interactions import quick_actions
     
-    with gr.Group(elem_classes="sidebar-panel"):
-        gr.HTML("""
-        <div class="panel-header">
-            📁 파일 업로드
-        </div>
-        """)
+    with gr.Group(elem_classes=_CLS_SIDEBAR_PANEL):
+        _materialize(components, 'upload_header')
         
-        with gr.Group(elem_classes="panel-content"):
-            components['file_upload'] = gr.File(
-                label="",
-                file_types=[".xlsx", ".xls", ".csv"],
-                file_count="multiple",
-                show_label=False,
-                container=False,
-                elem_classes="file-upload",
-                elem_id="file-upload"  # 접근성을 위한 ID 추가
-            )
-            
-            gr.HTML("""
-            <div class="upload-area">
-                <div style="font-size: 2em; margin-bottom: 10px;">📂</div>
-                <div style="font-weight: 600; margin-bottom: 5px;">
-                    파일을 드래그하거나 클릭하여 업로드
-                </div>
-                <div style="font-size: 12px; color: #666;">
-                    Excel (.xlsx, .xls), CSV 파일 지원<br>
-                    최대 100MB
-                </div>
-            </div>
-            """)
+        with gr.Group(elem_classes=_CLS_PANEL_CONTENT):
+            _materialize(components, 'file_upload')
             
             # 파일 템플릿 다운로드
             quick_actions.create_file_templates()
             
             # 업로드된 파일 목록 표시 영역
-            components['uploaded_files_display'] = gr.HTML("""
-            <div id="uploaded-files" style="margin-top: 15px;">
-                <div style="font-size: 14px; font-weight: 600; margin-bottom: 10px;">업로드된 파일:</div>
-                <div style="font-size: 12px; color: #666; font-style: italic;">
-                    아직 업로드된 파일이 없습니다.
-                </div>
-            </div>
-            """)
-    
-    return components
+            _materialize(components, 'uploaded_files')
 
 
-def _create_settings_section() -> Dict[str, Any]:
+def _create_settings_section(components: Dict[str, Any]) -> None:
     """설정 섹션 생성"""
-    components = {}
+    gr = _gr()
+    from app.ui.ai_status import ai_settings_panel
     
-    with gr.Group(elem_classes="sidebar-panel", elem_id="settings"):  # 접근성을 위한 ID 추가
-        gr.HTML("""
-        <div class="panel-header">
-            ⚙️ 설정
-        </div>
-        """)
+    with gr.Group(elem_classes=_CLS_SIDEBAR_PANEL, elem_id="settings"):  # 접근성을 위한 ID 추가
+        _materialize(components, 'settings_header')
         
-        with gr.Group(elem_classes="panel-content"):
+        with gr.Group(elem_classes=_CLS_PANEL_CONTENT):
             # 데이터베이스 연결 설정
             with gr.Accordion("🗄️ 데이터베이스 연결", open=False):
-                components['db_type'] = gr.Dropdown(
-                    choices=["PostgreSQL", "MySQL", "SQLite"],
-                    value="PostgreSQL",
-                    label="데이터베이스 타입",
-                    interactive=True
-                )
-                
-                components['db_host'] = gr.Textbox(
-                    label="호스트",
-                    placeholder="localhost",
-                    value="localhost"
-                )
-                
-                components['db_port'] = gr.Number(
-                    label="포트",
-                    value=5432,
-                    precision=0
-                )
-                
-                components['db_name'] = gr.Textbox(
-                    label="데이터베이스명",
-                    placeholder="database_name"
-                )
-                
-                components['db_test_button'] = gr.Button(
-                    "🔌 연결 테스트",
-                    variant="secondary",
-                    size="sm"
-                )
+                _materialize(components, 'db_connection')
             
             # AI 설정
-            ai_settings_components = ai_settings_panel.create_settings_panel()
-            components.update(ai_settings_components)
+            components.update(ai_settings_panel.create_settings_panel())
             
             # 애플리케이션 설정
             with gr.Accordion("🎨 애플리케이션 설정", open=False):
-                components['language_select'] = gr.Dropdown(
-                    choices=["한국어", "English"],
-                    value="한국어",
-                    label="언어 설정"
-                )
-                
-                components['theme_select'] = gr.Dropdown(
-                    choices=["라이트", "다크", "자동"],
-                    value="라이트", 
-                    label="테마 설정"
-                )
-                
-                components['chart_default'] = gr.Dropdown(
-                    choices=["자동 선택", "막대 차트", "선 차트", "파이 차트"],
-                    value="자동 선택",
-                    label="기본 차트 타입"
-                )
+                _materialize(components, 'app_settings')
             
-            # 시스템 상태
-            components['system_status'] = gr.HTML("""
-            <div style="margin-top: 20px; padding: 15px; background: #f8f9fa; border-radius: 8px;">
-                <div style="font-weight: 600; margin-bottom: 10px;">🔌 시스템 상태</div>
-                <div style="font-size: 13px; line-height: 1.6;">
-                    <div>
-                        <span class="status-indicator status-connected"></span>
-                        <strong>웹 서버:</strong> 정상 동작
-                    </div>
-                    <div>
-                        <span class="status-indicator status-connected"></span>
-                        <strong>데이터베이스:</strong> 연결됨
-                    </div>
-                    <div>
-                        <span class="status-indicator status-warning"></span>
-                        <strong>AI 엔진:</strong> 준비 중 (Week 2)
-                    </div>
-                    <div>
-                        <span class="status-indicator status-connected"></span>
-                        <strong>캐시:</strong> 활성화
-                    </div>
-                </div>
-            </div>
-            """)
-    
-    return components
+            # 시스템 상태 (상태 값이 바뀌면 이 블록만 다시 렌더링)
+            _materialize(components, 'system_status')
+            
+            @gr.render(inputs=[components['system_status']], trigger_mode="always_last")
+            def _render_system_status(status):
+                gr.HTML(_format_system_status(status))
 
 
-def _create_footer() -> gr.HTML:
+def _create_footer() -> "gr.HTML":
     """푸터 생성"""
-    return gr.HTML(f"""
-    <div style="
-        text-align: center; 
-        padding: 25px; 
-        margin-top: 40px; 
-        border-top: 2px solid #e0e0e0;
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        border-radius: 12px;
-        color: #495057;
-    ">
-        <div style="display: flex; justify-content: center; align-items: center; margin-bottom: 10px;">
-            <div style="font-size: 1.2em; font-weight: 600;">
-                🤖 <strong>{settings.app_name}</strong>
-            </div>
-            <div style="margin: 0 15px; font-size: 1.2em; color: #ced4da;">|</div>
-            <div style="font-size: 0.9em;">
-                v{settings.app_version}
-            </div>
-        </div>
-        <div style="font-size: 0.85em; color: #6c757d; margin-bottom: 8px;">
-            <strong>Week 1:</strong> UI 기본 구성 완료 | 
-            <strong>다음:</strong> Week 2 AI 연동 예정
-        </div>
-        <div style="font-size: 0.9em; font-style: italic; color: #495057;">
-            <em>"데이터의 힘을 모든 사람에게"</em> 🌟
-        </div>
-    </div>
-    """)
+    return _gr().HTML(_FOOTER_HTML)
@@ -5,34 +5,79 @@ SQL 질의 사용자 인터페이스
 """
 
 import gradio as gr
-from typing import Dict, List, Any, Tuple, Optional
+from typing import AsyncIterator, ClassVar, Dict, List, Any, Set, Tuple, Optional
 import asyncio
-import json
+import re
+from html import escape
+import time
+import weakref
 import structlog
-from datetime import datetime
+from collections import OrderedDict, deque
+from types import MappingProxyType
 
-from app.services.sql_query_service import sql_query_service
+from app.config.settings import settings
 from app.core.database_schema import DatabaseSchemaInfo
 from app.ui.interactions import notification_manager, progress_tracker
-from app.services.visualization_service import visualization_service
 
 logger = structlog.get_logger()
 
+# 결과 dict에 키가 없거나 None일 때 쓰는 읽기 전용 빈 매핑 (호출마다 {} 생성 방지)
+_EMPTY = MappingProxyType({})
 
-class SQLInterface:
-    """SQL 질의 인터페이스"""
-    
-    def __init__(self):
-        self.schema_info = DatabaseSchemaInfo()
-        self.query_history = []
-    
-    def create_sql_interface(self) -> Dict[str, Any]:
-        """SQL 질의 인터페이스 생성"""
-        components = {}
-        
-        with gr.Tab("🗄️ SQL 데이터베이스 질의"):
-            # 헤더
-            gr.HTML("""
+# 예시 질문 (버튼 순서대로 example_btn_0 ~ example_btn_7)
+_EXAMPLE_QUESTIONS = (
+    "지난 달 총 매출은 얼마입니까?",
+    "가장 많이 팔린 제품 TOP 5는?",
+    "카테고리별 매출 현황을 보여주세요",
+    "서울 고객들의 평균 구매액은?",
+    "월별 매출 트렌드는 어떻게 되나요?",
+    "재고가 가장 많은 제품은?",
+    "고객 연령대별 구매 패턴은?",
+    "주문 상태별 통계를 보여주세요"
+)
+_EXAMPLE_ROW_SIZE = 4
+# 버튼 행 단위로 미리 나눈 (시작 인덱스, 질문들) 목록
+_EXAMPLE_ROWS = tuple(
+    (start, _EXAMPLE_QUESTIONS[start:start + _EXAMPLE_ROW_SIZE])
+    for start in range(0, len(_EXAMPLE_QUESTIONS), _EXAMPLE_ROW_SIZE)
+)
+
+# 질의 기록 보관 개수 (오래된 기록은 자동으로 밀려남)
+_HISTORY_SIZE = 10
+
+# 질의 기록용 SQL 정규화 패턴 (주석 제거, 공백 축약)
+_SQL_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_SQL_WHITESPACE_RE = re.compile(r"\s+")
+
+# 질의 기록 시각 표시 형식
+_HISTORY_TIME_FORMAT = "%H:%M:%S"
+
+# 로그에 남길 질문 최대 길이 (긴 질문이 로그 처리/저장 비용을 키우지 않도록)
+_LOG_QUESTION_LIMIT = 200
+
+# 결과 패널에 표시할 답변/오류 메시지 최대 길이 (비정상적으로 긴 LLM 응답으로 화면이 무거워지지 않도록)
+_RESULT_TEXT_LIMIT = 5000
+# 질의 기록에 표시할 질문/SQL 최대 길이
+_HISTORY_QUESTION_LIMIT = 100
+_HISTORY_SQL_LIMIT = 150
+
+# 자연어 질의 결과 캐시 크기 (같은 질문은 LLM 호출 없이 재사용)
+_NL_CACHE_SIZE = 128
+
+# 자연어 질의 결과 캐시 유효 시간 (초) - 데이터 변경이 곧 반영되도록 짧게 유지
+_NL_CACHE_TTL = 60
+
+# 기다리는 화면 없이 결과 캐시용으로만 계속 실행하는 질의 최대 개수 (넘으면 오래된 것부터 취소)
+_DETACHED_QUERY_LIMIT = 4
+
+# 결과 표 한 페이지 행 수 (나머지 행은 서버에 두고 '더 보기'로 이어서 전송)
+_RESULT_PAGE_SIZE = 100
+
+# 페이지를 보관할 최대 세션 수 (오래 사용하지 않은 세션부터 제거)
+_RESULT_PAGES_SIZE = 64
+
+# 결과 영역 HTML 템플릿 (고정 마크업은 한 번만 정의하고 값만 채움)
+_HEADER_HTML = """
             <div style="
                 background: linear-gradient(135deg, #2E8B57 0%, #006400 100%);
                 color: white;
@@ -46,7 +91,224 @@ class SQLInterface:
                     자연어로 질문하면 AI가 SQL 쿼리를 생성하여 데이터베이스를 조회합니다
                 </p>
             </div>
-            """)
+            """
+
+_SCHEMA_PLACEHOLDER_HTML = "<p style='color: #666;'>테이블 구조를 불러오는 중...</p>"
+
+_EMPTY_HISTORY_HTML = "<p style='color: #666;'>아직 실행된 질의가 없습니다.</p>"
+
+# 질의 기록 - 항목마다 값만 채워 이어 붙임
+_HISTORY_OPEN = "<div style='font-size: 14px;'>"
+_HISTORY_CLOSE = "</div>"
+_HISTORY_ENTRY_TEMPLATE = """
+            <div style="
+                border: 1px solid #e9ecef;
+                border-radius: 8px;
+                padding: 12px;
+                margin-bottom: 10px;
+                background: {background};
+            ">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
+                    <span style="font-weight: 600; color: {status_color};">
+                        {status_icon} 질의 #{number}
+                    </span>
+                    <span style="font-size: 12px; color: #6c757d;">
+                        {timestamp} ({execution_time:.2f}초{cached_note})
+                    </span>
+                </div>
+                <div style="color: #495057; margin-bottom: 5px;">
+                    {question}
+                </div>
+                {sql_html}
+            </div>
+            """
+_HISTORY_SQL_TEMPLATE = '<div style="font-size: 12px; color: #6c757d; font-family: monospace;">{sql}</div>'
+
+_WELCOME_HTML = """
+        <div style="
+            background: #e8f5e8;
+            border: 1px solid #c3e6c3;
+            border-radius: 12px;
+            padding: 20px;
+            text-align: center;
+            margin: 20px 0;
+        ">
+            <h3 style="margin: 0 0 15px 0; color: #2E8B57;">🗄️ SQL 질의 준비 완료!</h3>
+            <p style="margin: 0 0 10px 0; color: #555;">
+                자연어로 질문을 입력하거나 예시 질문을 클릭해보세요.
+            </p>
+            <div style="
+                background: #fff;
+                padding: 15px;
+                border-radius: 8px;
+                margin-top: 15px;
+                text-align: left;
+                font-size: 14px;
+            ">
+                <strong>💡 사용 팁:</strong><br>
+                • 구체적인 질문일수록 정확한 결과를 얻을 수 있습니다<br>
+                • 날짜, 숫자, 카테고리 등을 명시해주세요<br>
+                • 예: "2024년 1월 스마트폰 카테고리 매출"
+            </div>
+        </div>
+        """
+
+# 질의 결과 템플릿 - 스타일은 layouts.css의 sql-result 클래스로 지정되어 응답 크기가 작음
+_SUCCESS_TEMPLATE = """<div class="sql-result sql-result-success">
+<h3>✅ 질의 실행 완료</h3>
+<div class="sql-result-body">{answer}</div>
+<div class="sql-result-time">⏱️ 실행 시간: {execution_time:.2f}초{cached_note}</div>
+</div>"""
+
+# 캐시 적중 결과 표시 (실행 시간 옆에 붙음)
+_CACHED_NOTE = " · 캐시된 결과"
+
+_DIRECT_SQL_ROWS_TEMPLATE = """<div class="sql-result sql-result-info">
+<h3>⚡ SQL 실행 완료</h3>
+<div class="sql-result-body"><p><strong>📊 조회된 행 수:</strong> {row_count}개</p>{summary}</div>
+<div class="sql-result-time">⏱️ 실행 시간: {execution_time:.2f}초</div>
+</div>"""
+
+_DIRECT_SQL_MESSAGE_TEMPLATE = """<div class="sql-result sql-result-info">
+<h3>⚡ SQL 실행 완료</h3>
+<p>{message}</p>
+<div class="sql-result-time">⏱️ 실행 시간: {execution_time:.2f}초</div>
+</div>"""
+
+_ERROR_TEMPLATE = """<div class="sql-result sql-result-error">
+<h3>❌ 질의 실행 실패</h3>
+<div class="sql-result-body">{error}</div>
+<div class="sql-result-time">⏱️ 실행 시간: {execution_time:.2f}초</div>
+</div>"""
+
+_QUERY_EXCEPTION_TEMPLATE = """<div class="sql-result sql-result-error sql-result-compact">
+<h4>❌ 실행 오류</h4>
+<p>질의 실행 중 오류가 발생했습니다: {error}</p>
+</div>"""
+
+_DIRECT_SQL_EXCEPTION_TEMPLATE = """<div class="sql-result sql-result-error sql-result-compact">
+<h4>❌ SQL 실행 오류</h4>
+<p>{error}</p>
+</div>"""
+
+_PAGE_NOTE_TEMPLATE = """<div class="sql-result-time">전체 {total}행 중 {shown}행을 먼저 표시합니다. 나머지는 '더 보기'로 불러올 수 있습니다.</div>"""
+
+# 분석 인사이트 - 인사이트 목록만 가변 길이이므로 항목 템플릿을 따로 둠
+_INSIGHTS_OPEN_TEMPLATE = """
+        <div style="
+            background: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 12px;
+            padding: 20px;
+            margin: 15px 0;
+        ">
+            <h3 style="margin: 0 0 15px 0; color: #495057;">🧠 분석 인사이트</h3>
+            
+            <div style="margin-bottom: 15px;">
+                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📊 차트 정보</h4>
+                <p style="margin: 0; font-size: 14px;">
+                    <strong>차트 유형:</strong> {chart_type}<br>
+                    <strong>선택 이유:</strong> {selection_reason}
+                </p>
+            </div>
+            
+            <div style="margin-bottom: 15px;">
+                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📈 주요 인사이트</h4>
+                <ul style="margin: 0; padding-left: 20px; font-size: 14px;">
+        """
+_INSIGHT_ITEM_TEMPLATE = "<li>{}</li>"
+_INSIGHTS_LIST_CLOSE = """
+                </ul>
+            </div>
+        """
+_INSIGHTS_SUMMARY_TEMPLATE = """
+            <div>
+                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📋 데이터 요약</h4>
+                <div style="
+                    background: white;
+                    padding: 10px;
+                    border-radius: 6px;
+                    font-size: 12px;
+                    color: #6c757d;
+                ">
+                    데이터 크기: {total_rows}행 × {total_columns}열 |
+                    숫자 컬럼: {numeric_columns}개 |
+                    텍스트 컬럼: {categorical_columns}개 |
+                    메모리 사용량: {memory_usage}
+                </div>
+            </div>
+            """
+
+# DB 연결 상태 - (배경, 테두리, 글자색)만 다름
+_DB_STATUS_TEMPLATE = """
+                <div style="
+                    background: {background};
+                    border: 1px solid {border};
+                    color: {color};
+                    padding: 10px;
+                    border-radius: 6px;
+                    margin: 5px 0;
+                    font-size: 12px;
+                ">
+                    {message}
+                </div>
+                """
+_DB_STATUS_SUCCESS_STYLE = {"background": "#d4edda", "border": "#c3e6cb", "color": "#155724"}
+_DB_STATUS_FAILURE_STYLE = {"background": "#f8d7da", "border": "#f5c6cb", "color": "#721c24"}
+_DB_STATUS_WARNING_STYLE = {"background": "#fff3cd", "border": "#ffeaa7", "color": "#856404"}
+
+
+def _escape_text(text: Any, limit: int = _RESULT_TEXT_LIMIT) -> str:
+    """길이를 제한한 뒤 HTML 이스케이프 (자른 뒤 이스케이프해야 엔티티가 잘리지 않음)"""
+    text = str(text)
+    if len(text) > limit:
+        text = text[:limit] + "..."
+    return escape(text)
+
+
+class SQLInterface:
+    """SQL 질의 인터페이스"""
+    
+    # 스키마 패널 HTML - 테이블 설명은 고정값이므로 모든 인스턴스가 공유
+    _schema_html: ClassVar[Optional[str]] = None
+    
+    def __init__(self):
+        self.schema_info = DatabaseSchemaInfo()
+        self.query_history: "deque[Dict[str, Any]]" = deque(maxlen=_HISTORY_SIZE)
+        self._nl_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._inflight_queries: Dict[Optional[str], asyncio.Task] = {}
+        # 같은 세션의 새 질의로 대체되어 취소된 작업 (이 경우만 조용히 종료)
+        self._superseded_queries: Set[asyncio.Task] = set()
+        # 진행 중인 서비스 호출 (정규화된 질문 → [작업, 기다리는 화면 수]) - 같은 질문은 호출 하나를 공유
+        self._service_queries: Dict[str, List[Any]] = {}
+        # 기다리는 화면이 모두 떠났지만 결과를 캐시에 남기려고 계속 실행 중인 호출 (오래된 순)
+        self._detached_queries: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+        self._advanced_available: Optional[bool] = None
+        # 세션별 마지막 결과 전체 행과 지금까지 보낸 행 수
+        self._result_pages: "OrderedDict[Optional[str], Tuple[List[Dict[str, Any]], int]]" = OrderedDict()
+        # 마지막으로 탭을 만든 Blocks(약한 참조)와 그때의 컴포넌트
+        self._components_cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+        # 마지막으로 포맷한 기록 시각 (초 단위, 문자열) - 같은 초의 기록은 재사용
+        self._history_time: Tuple[int, str] = (0, "")
+    
+    def create_sql_interface(self) -> Dict[str, Any]:
+        """
+        SQL 질의 인터페이스 생성
+        
+        같은 Blocks 안에서 다시 호출되면 이미 만든 컴포넌트를 그대로 반환합니다.
+        컴포넌트는 만들어진 Blocks에 묶이므로 새 Blocks에서는 다시 생성합니다.
+        """
+        root_block = gr.context.Context.root_block
+        if self._components_cache is not None:
+            cached_root, cached_components = self._components_cache
+            if root_block is not None and cached_root() is root_block:
+                return cached_components
+        
+        components = {}
+        
+        with gr.Tab("🗄️ SQL 데이터베이스 질의"):
+            # 헤더
+            gr.HTML(_HEADER_HTML)
             
             with gr.Row():
                 # 왼쪽: 질의 영역
@@ -114,7 +376,14 @@ class SQLInterface:
                         label="📊 조회 결과",
                         visible=False,
                         wrap=True,
-                        max_rows=20
+                        max_rows=_RESULT_PAGE_SIZE
+                    )
+                    
+                    components['result_load_more_btn'] = gr.Button(
+                        "⬇️ 더 보기",
+                        size="sm",
+                        variant="secondary",
+                        visible=False
                     )
                     
                     # 시각화 차트 (새로 추가)
@@ -132,41 +401,27 @@ class SQLInterface:
             # 질의 기록
             with gr.Accordion("📜 질의 기록", open=False):
                 components['query_history_display'] = gr.HTML(
-                    value="<p style='color: #666;'>아직 실행된 질의가 없습니다.</p>"
+                    value=_EMPTY_HISTORY_HTML
                 )
         
+        if root_block is not None:
+            self._components_cache = (weakref.ref(root_block), components)
+        
         return components
     
     def _create_example_questions(self) -> Dict[str, Any]:
         """예시 질문 버튼들 생성"""
         components = {}
         
-        example_questions = [
-            "지난 달 총 매출은 얼마입니까?",
-            "가장 많이 팔린 제품 TOP 5는?",
-            "카테고리별 매출 현황을 보여주세요",
-            "서울 고객들의 평균 구매액은?",
-            "월별 매출 트렌드는 어떻게 되나요?",
-            "재고가 가장 많은 제품은?",
-            "고객 연령대별 구매 패턴은?",
-            "주문 상태별 통계를 보여주세요"
-        ]
-        
-        with gr.Row():
-            for i, question in enumerate(example_questions[:4]):
-                components[f'example_btn_{i}'] = gr.Button(
-                    question,
-                    size="sm",
-                    variant="secondary"
-                )
-        
-        with gr.Row():
-            for i, question in enumerate(example_questions[4:], 4):
-                components[f'example_btn_{i}'] = gr.Button(
-                    question,
-                    size="sm",
-                    variant="secondary"
-                )
+        # 한 줄에 _EXAMPLE_ROW_SIZE개씩 배치
+        for start, questions in _EXAMPLE_ROWS:
+            with gr.Row():
+                for i, question in enumerate(questions, start):
+                    components[f'example_btn_{i}'] = gr.Button(
+                        question,
+                        size="sm",
+                        variant="secondary"
+                    )
         
         return components
     
@@ -174,17 +429,39 @@ class SQLInterface:
         """스키마 정보 패널 생성"""
         components = {}
         
-        with gr.Accordion("🗄️ 데이터베이스 스키마", open=True):
-            # 테이블 목록
-            table_info = self.schema_info.get_table_info()
+        with gr.Accordion("🗄️ 데이터베이스 스키마", open=False) as schema_accordion:
+            # 테이블 목록은 아코디언을 처음 펼칠 때 채움 (스키마 HTML은 한 번만 생성 후 재사용)
+            components['schema_display'] = gr.HTML(_SCHEMA_PLACEHOLDER_HTML)
+            
+            # 연결 상태 테스트
+            components['db_connection_btn'] = gr.Button(
+                "🔌 DB 연결 테스트",
+                variant="secondary",
+                size="sm"
+            )
             
-            schema_html = """
+            components['db_status'] = gr.HTML("")
+        
+        components['schema_accordion'] = schema_accordion
+        return components
+    
+    def get_schema_html(self) -> str:
+        """스키마 정보 HTML 반환 (최초 호출 시 생성 후 모든 인스턴스에서 재사용)"""
+        cls = type(self)
+        if cls._schema_html is None:
+            cls._schema_html = self._build_schema_html(self.schema_info.get_table_info())
+        return cls._schema_html
+    
+    @staticmethod
+    def _build_schema_html(table_info: Dict[str, Dict[str, Any]]) -> str:
+        """테이블 정보로 스키마 HTML 생성"""
+        parts = ["""
             <div style="font-size: 14px;">
                 <h4 style="margin: 0 0 15px 0; color: #2E8B57;">📊 테이블 구조</h4>
-            """
-            
-            for table_name, info in table_info.items():
-                schema_html += f"""
+            """]
+        
+        for table_name, info in table_info.items():
+            parts.append(f"""
                 <div style="
                     background: #f8f9fa;
                     border: 1px solid #e9ecef;
@@ -199,64 +476,84 @@ class SQLInterface:
                         {info['description']}
                     </div>
                     <div style="font-size: 12px;">
-                """
-                
-                for col_name, col_desc in list(info['columns'].items())[:5]:  # 처음 5개만 표시
-                    schema_html += f"<div>• {col_name}: {col_desc}</div>"
-                
-                if len(info['columns']) > 5:
-                    schema_html += f"<div style='color: #6c757d;'>... 총 {len(info['columns'])}개 컬럼</div>"
-                
-                schema_html += "</div></div>"
-            
-            schema_html += "</div>"
-            
-            components['schema_display'] = gr.HTML(schema_html)
+                """)
             
-            # 연결 상태 테스트
-            components['db_connection_btn'] = gr.Button(
-                "🔌 DB 연결 테스트",
-                variant="secondary",
-                size="sm"
+            columns = info['columns']
+            parts.extend(
+                f"<div>• {col_name}: {col_desc}</div>"
+                for col_name, col_desc in list(columns.items())[:5]  # 처음 5개만 표시
             )
             
-            components['db_status'] = gr.HTML("")
+            if len(columns) > 5:
+                parts.append(f"<div style='color: #6c757d;'>... 총 {len(columns)}개 컬럼</div>")
+            
+            parts.append("</div></div>")
         
-        return components
+        parts.append("</div>")
+        return "".join(parts)
     
     def _create_welcome_message(self) -> str:
         """환영 메시지 생성"""
-        return """
-        <div style="
-            background: #e8f5e8;
-            border: 1px solid #c3e6c3;
-            border-radius: 12px;
-            padding: 20px;
-            text-align: center;
-            margin: 20px 0;
-        ">
-            <h3 style="margin: 0 0 15px 0; color: #2E8B57;">🗄️ SQL 질의 준비 완료!</h3>
-            <p style="margin: 0 0 10px 0; color: #555;">
-                자연어로 질문을 입력하거나 예시 질문을 클릭해보세요.
-            </p>
-            <div style="
-                background: #fff;
-                padding: 15px;
-                border-radius: 8px;
-                margin-top: 15px;
-                text-align: left;
-                font-size: 14px;
-            ">
-                <strong>💡 사용 팁:</strong><br>
-                • 구체적인 질문일수록 정확한 결과를 얻을 수 있습니다<br>
-                • 날짜, 숫자, 카테고리 등을 명시해주세요<br>
-                • 예: "2024년 1월 스마트폰 카테고리 매출"
-            </div>
-        </div>
+        return _WELCOME_HTML
+    
+    async def execute_natural_language_query(self, question: str, request: Optional[gr.Request] = None) -> AsyncIterator[Tuple[Any, ...]]:
+        """
+        자연어 질의 실행
+        
+        질의가 끝날 때까지 기다리지 않고 진행 상황 → 결과/SQL/표 → 차트/인사이트 순으로
+        준비되는 대로 보냅니다. 같은 세션에서 새 질의가 들어오면 아직 끝나지 않은 이전
+        질의는 취소하고, 취소된 질의는 화면을 갱신하지 않습니다.
         """
+        if not question.strip():
+            outputs, _ = await self._run_natural_language_query(question)
+            yield outputs
+            return
+        
+        # 진행 상황 표시 (나머지 출력은 이전 상태 유지)
+        progress_html = progress_tracker.start_progress([
+            "질문 분석 중...",
+            "SQL 쿼리 생성 중...",
+            "데이터베이스 조회 중...",
+            "결과 포맷팅 중..."
+        ])
+        yield (progress_html,) + tuple(gr.skip() for _ in range(8))
+        
+        session_id = request.session_hash if request is not None else None
+        
+        previous = self._inflight_queries.get(session_id)
+        if previous is not None and not previous.done():
+            self._superseded_queries.add(previous)
+            previous.cancel()
+        
+        task = asyncio.create_task(self._run_natural_language_query(question, session_id))
+        self._inflight_queries[session_id] = task
+        
+        try:
+            outputs, viz_source = await task
+            yield outputs
+            if viz_source is None:
+                return
+            
+            # 차트와 인사이트는 결과 표를 먼저 보낸 뒤 준비되는 대로 전송 (나머지 출력은 유지)
+            task = asyncio.create_task(asyncio.to_thread(self._build_visualization, *viz_source))
+            self._inflight_queries[session_id] = task
+            yield tuple(gr.skip() for _ in range(5)) + await task
+        except asyncio.CancelledError:
+            # 핸들러 자체의 취소(연결 종료, Gradio 취소 등)는 그대로 전파
+            if task not in self._superseded_queries or asyncio.current_task().cancelling():
+                raise
+            logger.info("이전 자연어 SQL 질의 취소", question=question[:_LOG_QUESTION_LIMIT])
+        finally:
+            self._superseded_queries.discard(task)
+            if self._inflight_queries.get(session_id) is task:
+                del self._inflight_queries[session_id]
     
-    async def execute_natural_language_query(self, question: str) -> Tuple[str, str, Any, bool, bool, Any, bool, str, bool]:
-        """자연어 질의 실행"""
+    async def _run_natural_language_query(self, question: str, session_id: Optional[str] = None) -> Tuple[Tuple[Any, ...], Optional[Tuple[Dict[str, Any], Any]]]:
+        """
+        자연어 질의 실행 본문
+        
+        화면 출력값과, 시각화가 필요한 경우 (질의 결과, 전체 행) 쌍을 반환합니다.
+        """
         if not question.strip():
             return (
                 notification_manager.show_error("질문을 입력해주세요."),
@@ -268,78 +565,30 @@ class SQLInterface:
                 False,  # chart visible
                 "",    # insights
                 False   # insights visible
-            )
+            ), None
         
         try:
-            # 진행률 표시
-            progress_html = progress_tracker.start_progress([
-                "질문 분석 중...",
-                "SQL 쿼리 생성 중...",
-                "데이터베이스 조회 중...",
-                "결과 포맷팅 중..."
-            ])
-            
-            logger.info("자연어 SQL 질의 시작", question=question)
+            logger.info("자연어 SQL 질의 시작", question=question[:_LOG_QUESTION_LIMIT])
             
-            # 고급 SQL 서비스 호출 (우선 시도)
-            try:
-                result = await sql_query_service.execute_advanced_query(question)
-                is_advanced = True
-            except Exception:
-                # 고급 서비스 실패 시 기본 서비스로 폴백
-                result = await sql_query_service.execute_natural_language_query(question)
-                is_advanced = False
+            result = self._get_cached_result(question)
+            if result is not None:
+                logger.info("자연어 SQL 질의 캐시 적중", question=question[:_LOG_QUESTION_LIMIT])
+            else:
+                result = await self._await_service_query(question)
             
             if result["success"]:
-                # 성공 결과 포맷팅
-                result_html = self._format_success_result(result)
-                executed_sql = result.get("sql", "")
+                # HTML 포맷팅은 CPU 작업이므로 이벤트 루프 밖에서 수행
+                outputs = await asyncio.to_thread(self._postprocess_success, result)
+                table_data = outputs[2]
                 
-                # 테이블 데이터 추출
-                table_data = None
-                if result["data"] and "table_data" in result["data"]:
-                    table_data = result["data"]["table_data"]
-                    if table_data and "data" in table_data:
-                        table_data = table_data["data"]
-                
-                # 시각화 생성
-                chart = None
-                insights_html = ""
-                chart_visible = False
-                insights_visible = False
-                
-                if table_data and len(table_data) > 0:
-                    try:
-                        viz_result = visualization_service.create_visualization(
-                            {"data": table_data},
-                            query_intent=result.get("advanced_analysis", {}).get("parsed_intent", {}).get("intent", "general")
-                        )
-                        
-                        if viz_result['success']:
-                            chart = viz_result['chart']
-                            chart_visible = True
-                            
-                            # 인사이트 HTML 생성
-                            insights_html = self._format_insights(viz_result)
-                            insights_visible = True
-                            
-                    except Exception as e:
-                        logger.warning("시각화 생성 실패", error=str(e))
+                # 결과 표에는 첫 페이지만 전송
+                page, page_note = self._first_page(table_data, session_id)
+                outputs = (outputs[0] + page_note, outputs[1], page) + outputs[3:]
                 
                 # 질의 기록 저장
                 self._add_to_history(question, result)
                 
-                return (
-                    result_html,
-                    executed_sql,
-                    table_data,
-                    True,  # executed_sql visible
-                    bool(table_data),  # dataframe visible
-                    chart,  # chart
-                    chart_visible,  # chart visible
-                    insights_html,  # insights
-                    insights_visible   # insights visible
-                )
+                return outputs, ((result, table_data) if table_data else None)
             else:
                 # 오류 결과 포맷팅
                 error_html = self._format_error_result(result)
@@ -353,26 +602,87 @@ class SQLInterface:
                     False,  # chart visible
                     "",    # insights
                     False   # insights visible
-                )
+                ), None
         
+        except asyncio.TimeoutError:
+            logger.warning("자연어 SQL 질의 시간 초과", question=question[:_LOG_QUESTION_LIMIT], timeout=settings.query_timeout)
+            error_html = _QUERY_EXCEPTION_TEMPLATE.format(error=f"질의 시간이 초과되었습니다 ({settings.query_timeout}초)")
+            return (error_html, "", None, False, False, None, False, "", False), None
         except Exception as e:
             logger.error("자연어 SQL 질의 실행 오류", error=str(e))
-            error_html = f"""
-            <div style="
-                background: #f8d7da;
-                border: 1px solid #f5c6cb;
-                color: #721c24;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 10px 0;
-            ">
-                <h4>❌ 실행 오류</h4>
-                <p>질의 실행 중 오류가 발생했습니다: {str(e)}</p>
-            </div>
-            """
-            return (error_html, "", None, False, False, None, False, "", False)
+            error_html = _QUERY_EXCEPTION_TEMPLATE.format(error=_escape_text(e))
+            return (error_html, "", None, False, False, None, False, "", False), None
+    
+    async def _await_service_query(self, question: str) -> Dict[str, Any]:
+        """
+        같은 질문의 서비스 호출을 공유하며 결과를 기다림
+        
+        기다리던 화면이 취소되어도 호출은 끝까지 실행해 결과를 캐시에 남기되,
+        그런 호출은 _DETACHED_QUERY_LIMIT개까지만 유지하고 시간 초과 시에는 취소합니다.
+        """
+        key = self._normalize_question(question)
+        entry = self._service_queries.get(key)
+        if entry is None:
+            query = asyncio.create_task(self._query_service(question))
+            entry = self._service_queries[key] = [query, 0]
+            query.add_done_callback(lambda done, key=key: self._forget_service_query(key, done))
+        
+        query = entry[0]
+        self._detached_queries.pop(key, None)
+        entry[1] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(query), timeout=settings.query_timeout)
+        except asyncio.TimeoutError:
+            query.cancel()
+            raise
+        except asyncio.CancelledError:
+            # 같은 호출을 기다리던 다른 화면이 시간 초과로 취소한 경우
+            if asyncio.current_task().cancelling() or not query.cancelled():
+                raise
+            raise asyncio.TimeoutError()
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not query.done():
+                self._detached_queries[key] = query
+                if len(self._detached_queries) > _DETACHED_QUERY_LIMIT:
+                    _, oldest = self._detached_queries.popitem(last=False)
+                    oldest.cancel()
     
-    async def execute_direct_sql(self, sql_query: str) -> Tuple[str, str, Any, bool, bool]:
+    def _forget_service_query(self, key: str, query: asyncio.Task):
+        """끝난 서비스 호출을 진행 중/분리 목록에서 제거"""
+        entry = self._service_queries.get(key)
+        if entry is not None and entry[0] is query:
+            del self._service_queries[key]
+        if self._detached_queries.get(key) is query:
+            del self._detached_queries[key]
+    
+    async def _query_service(self, question: str) -> Dict[str, Any]:
+        """SQL 질의 서비스 호출 (성공한 결과는 캐시에 저장)"""
+        # LLM 스택은 첫 질의 시점에 로드 (모듈 import 시간 단축)
+        from app.services.sql_query_service import sql_query_service
+        
+        # 고급 SQL 서비스 호출 (사용 불가로 확인된 경우 바로 기본 서비스 사용)
+        result = None
+        if self._advanced_available is not False:
+            try:
+                result = await sql_query_service.execute_advanced_query(question)
+                self._advanced_available = True
+            except (ImportError, AttributeError) as e:
+                # 모듈/메서드 자체가 없는 경우만 사용 불가로 고정
+                self._advanced_available = False
+                logger.warning("고급 SQL 서비스 사용 불가 - 기본 서비스로 전환", error=str(e))
+            except Exception as e:
+                # 일시적 오류는 이번 질의만 기본 서비스로 처리하고 다음 질의에서 다시 시도
+                logger.warning("고급 SQL 서비스 오류 - 이번 질의는 기본 서비스로 처리", error=str(e))
+        
+        if result is None:
+            result = await sql_query_service.execute_natural_language_query(question)
+        
+        if result["success"]:
+            self._cache_result(question, result)
+        return result
+    
+    async def execute_direct_sql(self, sql_query: str, request: Optional[gr.Request] = None) -> Tuple[str, str, Any, bool, bool]:
         """직접 SQL 실행"""
         if not sql_query.strip():
             return (
@@ -386,6 +696,7 @@ class SQLInterface:
         try:
             logger.info("직접 SQL 실행", sql=sql_query[:100])
             
+            from app.services.sql_query_service import sql_query_service
             result = await sql_query_service.execute_direct_sql(sql_query)
             
             if result["success"]:
@@ -394,7 +705,9 @@ class SQLInterface:
                 # 테이블 데이터 추출
                 table_data = None
                 if result["data"] and "data" in result["data"]:
-                    table_data = result["data"]["data"]
+                    session_id = request.session_hash if request is not None else None
+                    table_data, page_note = self._first_page(result["data"]["data"], session_id)
+                    result_html += page_note
                 
                 # 기록 저장
                 self._add_to_history(f"직접 SQL: {sql_query[:50]}...", result)
@@ -412,302 +725,278 @@ class SQLInterface:
         
         except Exception as e:
             logger.error("직접 SQL 실행 오류", error=str(e))
-            error_html = f"""
-            <div style="background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 15px; border-radius: 8px;">
-                <h4>❌ SQL 실행 오류</h4>
-                <p>{str(e)}</p>
-            </div>
-            """
+            error_html = _DIRECT_SQL_EXCEPTION_TEMPLATE.format(error=_escape_text(e))
             return (error_html, sql_query, None, True, False)
     
-    def _format_success_result(self, result: Dict[str, Any]) -> str:
-        """성공 결과 HTML 포맷팅"""
-        data = result.get("data", {})
-        answer = data.get("answer", "결과를 성공적으로 조회했습니다.")
-        execution_time = result.get("execution_time", 0)
+    def _postprocess_success(self, result: Dict[str, Any]) -> Tuple[str, str, Any, bool, bool, Any, bool, str, bool]:
+        """성공한 질의 결과를 화면 출력값으로 변환 (작업 스레드에서 실행, 차트는 이후 별도 전송)"""
+        # 성공 결과 포맷팅
+        result_html = self._format_success_result(result)
+        executed_sql = result.get("sql", "")
         
-        html = f"""
-        <div style="
-            background: #d4edda;
-            border: 1px solid #c3e6cb;
-            color: #155724;
-            padding: 20px;
-            border-radius: 12px;
-            margin: 15px 0;
-        ">
-            <h3 style="margin: 0 0 15px 0;">✅ 질의 실행 완료</h3>
-            <div style="
-                background: white;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 10px 0;
-                color: #333;
-                line-height: 1.6;
-            ">
-                {answer}
-            </div>
-            <div style="font-size: 12px; color: #6c757d; margin-top: 10px;">
-                ⏱️ 실행 시간: {execution_time:.2f}초
-            </div>
-        </div>
+        # 테이블 데이터 추출
+        table_data = (result["data"] or _EMPTY).get("table_data")
+        if table_data and "data" in table_data:
+            table_data = table_data["data"]
+        
+        return (
+            result_html,
+            executed_sql,
+            table_data,
+            True,  # executed_sql visible
+            bool(table_data),  # dataframe visible
+            None,  # chart (이전 차트 제거)
+            False,  # chart visible
+            "",  # insights
+            False  # insights visible
+        )
+    
+    def _build_visualization(self, result: Dict[str, Any], table_data: Any) -> Tuple[Any, bool, str, bool]:
+        """질의 결과 전체 행으로 차트와 인사이트 생성 (작업 스레드에서 실행)"""
+        try:
+            from app.services.visualization_service import visualization_service
+            
+            parsed_intent = (result.get("advanced_analysis") or _EMPTY).get("parsed_intent") or _EMPTY
+            viz_result = visualization_service.create_visualization(
+                {"data": table_data},
+                query_intent=parsed_intent.get("intent", "general")
+            )
+            
+            if viz_result['success']:
+                # 인사이트 HTML 생성 (표시할 내용이 없으면 패널 숨김)
+                insights_html = self._format_insights(viz_result)
+                return viz_result['chart'], True, insights_html, bool(insights_html)
+                
+        except Exception as e:
+            logger.warning("시각화 생성 실패", error=str(e))
+        
+        return None, False, "", False
+    
+    def _first_page(self, table_data: Any, session_id: Optional[str]) -> Tuple[Any, str]:
         """
+        결과 표에 보낼 첫 페이지만 남김
+        
+        Gradio는 max_rows와 관계없이 전달된 모든 행을 직렬화하므로, 행이 많으면
+        _RESULT_PAGE_SIZE행만 보내고 전체 행은 세션별로 보관해 load_more_results에서 이어서 보냅니다.
+        """
+        self._result_pages.pop(session_id, None)
+        if not table_data or len(table_data) <= _RESULT_PAGE_SIZE:
+            return self._to_table(table_data), ""
+        
+        self._result_pages[session_id] = (table_data, _RESULT_PAGE_SIZE)
+        if len(self._result_pages) > _RESULT_PAGES_SIZE:
+            self._result_pages.popitem(last=False)
         
-        return html
+        note = _PAGE_NOTE_TEMPLATE.format(total=len(table_data), shown=_RESULT_PAGE_SIZE)
+        return self._to_table(table_data[:_RESULT_PAGE_SIZE]), note
+    
+    @staticmethod
+    def _to_table(rows: Any) -> Any:
+        """
+        결과 행(dict 목록)을 DataFrame 컴포넌트의 headers/data 형식으로 변환
+        
+        행 dict를 그대로 넘기면 컴포넌트가 행 단위로 다시 해석해야 하므로,
+        열 이름은 한 번만 뽑고 값은 행마다 목록으로 묶어 그대로 전달되게 합니다.
+        """
+        if not rows or not isinstance(rows[0], dict):
+            return rows
+        return {"headers": list(rows[0]), "data": [list(row.values()) for row in rows]}
+    
+    def load_more_results(self, request: Optional[gr.Request] = None) -> Tuple[Any, Any]:
+        """결과 표에 다음 페이지를 이어 붙여 반환"""
+        session_id = request.session_hash if request is not None else None
+        entry = self._result_pages.get(session_id)
+        if entry is None:
+            return gr.skip(), gr.update(visible=False)
+        
+        rows, shown = entry
+        shown = min(shown + _RESULT_PAGE_SIZE, len(rows))
+        self._result_pages[session_id] = (rows, shown)
+        self._result_pages.move_to_end(session_id)
+        
+        return self._to_table(rows[:shown]), gr.update(visible=shown < len(rows))
+    
+    def get_load_more_update(self, request: Optional[gr.Request] = None) -> Any:
+        """현재 세션 결과에 남은 행이 있을 때만 '더 보기' 버튼 표시"""
+        session_id = request.session_hash if request is not None else None
+        entry = self._result_pages.get(session_id)
+        return gr.update(visible=entry is not None and entry[1] < len(entry[0]))
+    
+    def _format_success_result(self, result: Dict[str, Any]) -> str:
+        """성공 결과 HTML 포맷팅"""
+        data = result.get("data") or _EMPTY
+        return _SUCCESS_TEMPLATE.format(
+            answer=_escape_text(data.get("answer", "결과를 성공적으로 조회했습니다.")),
+            execution_time=result.get("execution_time", 0),
+            cached_note=_CACHED_NOTE if result.get("cached") else ""
+        )
     
     def _format_direct_sql_result(self, result: Dict[str, Any]) -> str:
         """직접 SQL 결과 포맷팅"""
-        data = result.get("data", {})
+        data = result.get("data") or _EMPTY
         execution_time = result.get("execution_time", 0)
         
         if "row_count" in data:
-            row_count = data["row_count"]
             summary = data.get("summary", "")
-            
-            html = f"""
-            <div style="
-                background: #d1ecf1;
-                border: 1px solid #bee5eb;
-                color: #0c5460;
-                padding: 20px;
-                border-radius: 12px;
-                margin: 15px 0;
-            ">
-                <h3 style="margin: 0 0 15px 0;">⚡ SQL 실행 완료</h3>
-                <div style="
-                    background: white;
-                    padding: 15px;
-                    border-radius: 8px;
-                    color: #333;
-                ">
-                    <p><strong>📊 조회된 행 수:</strong> {row_count}개</p>
-                    {f'<p><strong>📈 요약:</strong> {summary}</p>' if summary else ''}
-                </div>
-                <div style="font-size: 12px; color: #6c757d; margin-top: 10px;">
-                    ⏱️ 실행 시간: {execution_time:.2f}초
-                </div>
-            </div>
-            """
-        else:
-            message = data.get("message", "쿼리가 실행되었습니다.")
-            html = f"""
-            <div style="
-                background: #d1ecf1;
-                border: 1px solid #bee5eb;
-                color: #0c5460;
-                padding: 20px;
-                border-radius: 12px;
-                margin: 15px 0;
-            ">
-                <h3 style="margin: 0 0 15px 0;">⚡ SQL 실행 완료</h3>
-                <p>{message}</p>
-                <div style="font-size: 12px; color: #6c757d; margin-top: 10px;">
-                    ⏱️ 실행 시간: {execution_time:.2f}초
-                </div>
-            </div>
-            """
+            return _DIRECT_SQL_ROWS_TEMPLATE.format(
+                row_count=data["row_count"],
+                summary=f'<p><strong>📈 요약:</strong> {_escape_text(summary)}</p>' if summary else '',
+                execution_time=execution_time
+            )
         
-        return html
+        return _DIRECT_SQL_MESSAGE_TEMPLATE.format(
+            message=_escape_text(data.get("message", "쿼리가 실행되었습니다.")),
+            execution_time=execution_time
+        )
     
     def _format_error_result(self, result: Dict[str, Any]) -> str:
         """오류 결과 포맷팅"""
-        error = result.get("error", "알 수 없는 오류가 발생했습니다.")
-        execution_time = result.get("execution_time", 0)
-        
-        return f"""
-        <div style="
-            background: #f8d7da;
-            border: 1px solid #f5c6cb;
-            color: #721c24;
-            padding: 20px;
-            border-radius: 12px;
-            margin: 15px 0;
-        ">
-            <h3 style="margin: 0 0 15px 0;">❌ 질의 실행 실패</h3>
-            <div style="
-                background: white;
-                padding: 15px;
-                border-radius: 8px;
-                color: #333;
-                line-height: 1.6;
-            ">
-                {error}
-            </div>
-            <div style="font-size: 12px; color: #6c757d; margin-top: 10px;">
-                ⏱️ 실행 시간: {execution_time:.2f}초
-            </div>
-        </div>
-        """
+        return _ERROR_TEMPLATE.format(
+            error=_escape_text(result.get("error", "알 수 없는 오류가 발생했습니다.")),
+            execution_time=result.get("execution_time", 0)
+        )
     
     def _format_insights(self, viz_result: Dict[str, Any]) -> str:
-        """시각화 인사이트를 HTML로 포맷팅"""
-        insights = viz_result.get('insights', [])
-        chart_type = viz_result.get('chart_type', 'unknown')
-        selection_reason = viz_result.get('selection_reason', '')
-        data_summary = viz_result.get('data_summary', {})
+        """시각화 인사이트를 HTML로 포맷팅 (인사이트, 선택 이유, 데이터 요약이 모두 없으면 빈 문자열)"""
+        data_summary = viz_result.get('data_summary') or _EMPTY
+        insights = viz_result.get('insights') or ()
+        selection_reason = viz_result.get('selection_reason')
+        if not insights and not data_summary and not selection_reason:
+            return ""
         
-        html = f"""
-        <div style="
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 12px;
-            padding: 20px;
-            margin: 15px 0;
-        ">
-            <h3 style="margin: 0 0 15px 0; color: #495057;">🧠 분석 인사이트</h3>
-            
-            <div style="margin-bottom: 15px;">
-                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📊 차트 정보</h4>
-                <p style="margin: 0; font-size: 14px;">
-                    <strong>차트 유형:</strong> {chart_type.title()}<br>
-                    <strong>선택 이유:</strong> {selection_reason}
-                </p>
-            </div>
-            
-            <div style="margin-bottom: 15px;">
-                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📈 주요 인사이트</h4>
-                <ul style="margin: 0; padding-left: 20px; font-size: 14px;">
+        parts = [_INSIGHTS_OPEN_TEMPLATE.format(
+            chart_type=viz_result.get('chart_type', 'unknown').title(),
+            selection_reason=_escape_text(selection_reason or '')
+        )]
+        parts.extend(_INSIGHT_ITEM_TEMPLATE.format(_escape_text(insight)) for insight in insights)
+        parts.append(_INSIGHTS_LIST_CLOSE)
+        
+        if data_summary:
+            parts.append(_INSIGHTS_SUMMARY_TEMPLATE.format(
+                total_rows=data_summary.get('total_rows', 0),
+                total_columns=data_summary.get('total_columns', 0),
+                numeric_columns=data_summary.get('numeric_columns', 0),
+                categorical_columns=data_summary.get('categorical_columns', 0),
+                memory_usage=data_summary.get('memory_usage', 'N/A')
+            ))
+        
+        parts.append("</div>")
+        return "".join(parts)
+    
+    @staticmethod
+    def _normalize_question(question: str) -> str:
+        """캐시 키용 질문 정규화 (공백/대소문자 차이 무시)"""
+        return " ".join(question.split()).lower()
+    
+    @staticmethod
+    def _canonicalize_sql(sql: str) -> str:
         """
+        기록용 SQL 정규화 (주석 제거, 공백 한 칸으로 축약, 끝 세미콜론 제거)
         
-        for insight in insights:
-            html += f"<li>{insight}</li>"
+        리터럴 값은 그대로 두므로 값이 다른 쿼리는 서로 다른 SQL로 남습니다.
+        """
+        sql = _SQL_COMMENT_RE.sub(" ", sql)
+        return _SQL_WHITESPACE_RE.sub(" ", sql).strip().rstrip(";").rstrip()
+    
+    def _get_cached_result(self, question: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 질의 결과 반환 (없거나 만료되면 None)
         
-        html += """
-                </ul>
-            </div>
+        캐시 항목은 모든 세션이 공유하므로 복사본을 반환하고, 실행 시간은 원래 LLM/DB 실행 시간 대신
+        이번 조회에 걸린 시간으로 바꾸며 캐시 적중 여부를 표시합니다.
         """
+        started = time.perf_counter()
+        key = self._normalize_question(question)
+        entry = self._nl_cache.get(key)
+        if entry is None:
+            return None
         
-        if data_summary:
-            html += f"""
-            <div>
-                <h4 style="color: #6c757d; margin: 0 0 8px 0;">📋 데이터 요약</h4>
-                <div style="
-                    background: white;
-                    padding: 10px;
-                    border-radius: 6px;
-                    font-size: 12px;
-                    color: #6c757d;
-                ">
-                    데이터 크기: {data_summary.get('total_rows', 0)}행 × {data_summary.get('total_columns', 0)}열 |
-                    숫자 컬럼: {data_summary.get('numeric_columns', 0)}개 |
-                    텍스트 컬럼: {data_summary.get('categorical_columns', 0)}개 |
-                    메모리 사용량: {data_summary.get('memory_usage', 'N/A')}
-                </div>
-            </div>
-            """
+        result, cached_at = entry
+        if time.monotonic() - cached_at > _NL_CACHE_TTL:
+            del self._nl_cache[key]
+            return None
         
-        html += "</div>"
-        return html
+        self._nl_cache.move_to_end(key)
+        return {**result, "execution_time": time.perf_counter() - started, "cached": True}
+    
+    def _cache_result(self, question: str, result: Dict[str, Any]):
+        """성공한 질의 결과를 캐시에 저장 (가장 오래 쓰이지 않은 항목부터 제거)"""
+        key = self._normalize_question(question)
+        self._nl_cache[key] = (result, time.monotonic())
+        self._nl_cache.move_to_end(key)
+        
+        if len(self._nl_cache) > _NL_CACHE_SIZE:
+            self._nl_cache.popitem(last=False)
     
     def _add_to_history(self, question: str, result: Dict[str, Any]):
-        """질의 기록에 추가"""
+        """질의 기록에 추가 (최근 _HISTORY_SIZE개만 유지)"""
+        second = int(time.time())
+        if second != self._history_time[0]:
+            self._history_time = (second, time.strftime(_HISTORY_TIME_FORMAT, time.localtime(second)))
+        
         self.query_history.append({
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": self._history_time[1],
             "question": question,
             "success": result["success"],
             "execution_time": result.get("execution_time", 0),
-            "sql": result.get("sql", "")
+            "cached": result.get("cached", False),
+            "sql": self._canonicalize_sql(result.get("sql") or "")
         })
-        
-        # 최근 10개만 유지
-        if len(self.query_history) > 10:
-            self.query_history = self.query_history[-10:]
     
     def get_query_history_html(self) -> str:
         """질의 기록 HTML 생성"""
         if not self.query_history:
-            return "<p style='color: #666;'>아직 실행된 질의가 없습니다.</p>"
+            return _EMPTY_HISTORY_HTML
         
-        html = "<div style='font-size: 14px;'>"
+        parts = [_HISTORY_OPEN]
+        total = len(self.query_history)
         
-        for i, record in enumerate(reversed(self.query_history), 1):
-            status_icon = "✅" if record["success"] else "❌"
-            status_color = "#28a745" if record["success"] else "#dc3545"
+        for i, record in enumerate(reversed(self.query_history)):
+            success = record["success"]
+            sql = record["sql"]
             
-            html += f"""
-            <div style="
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                padding: 12px;
-                margin-bottom: 10px;
-                background: {'#f8f9fa' if record['success'] else '#fff5f5'};
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="font-weight: 600; color: {status_color};">
-                        {status_icon} 질의 #{len(self.query_history) - i + 1}
-                    </span>
-                    <span style="font-size: 12px; color: #6c757d;">
-                        {record['timestamp']} ({record['execution_time']:.2f}초)
-                    </span>
-                </div>
-                <div style="color: #495057; margin-bottom: 5px;">
-                    {record['question'][:100]}{'...' if len(record['question']) > 100 else ''}
-                </div>
-                {f'<div style="font-size: 12px; color: #6c757d; font-family: monospace;">{record["sql"][:150]}{"..." if len(record["sql"]) > 150 else ""}</div>' if record["sql"] else ''}
-            </div>
-            """
+            parts.append(_HISTORY_ENTRY_TEMPLATE.format(
+                background='#f8f9fa' if success else '#fff5f5',
+                status_color="#28a745" if success else "#dc3545",
+                status_icon="✅" if success else "❌",
+                number=total - i,
+                timestamp=record['timestamp'],
+                execution_time=record['execution_time'],
+                cached_note=_CACHED_NOTE if record['cached'] else '',
+                question=_escape_text(record["question"], _HISTORY_QUESTION_LIMIT),
+                sql_html=_HISTORY_SQL_TEMPLATE.format(sql=_escape_text(sql, _HISTORY_SQL_LIMIT)) if sql else ''
+            ))
         
-        html += "</div>"
-        return html
+        parts.append(_HISTORY_CLOSE)
+        return "".join(parts)
     
-    def clear_interface(self) -> Tuple[str, str, str, None, bool, bool]:
+    def clear_interface(self, request: Optional[gr.Request] = None) -> Tuple[str, str, str, None, bool, bool]:
         """인터페이스 초기화"""
         self.query_history.clear()
+        self._result_pages.pop(request.session_hash if request is not None else None, None)
         return (
             "",  # question input
-            self._create_welcome_message(),  # result display
+            _WELCOME_HTML,  # result display
             "",  # executed sql
             None,  # dataframe
             False,  # sql visible
             False   # dataframe visible
         )
     
-    def test_database_connection(self) -> str:
+    async def test_database_connection(self) -> str:
         """데이터베이스 연결 테스트"""
         try:
-            success, message = sql_query_service.test_database_connection()
-            
-            if success:
-                return f"""
-                <div style="
-                    background: #d4edda;
-                    border: 1px solid #c3e6cb;
-                    color: #155724;
-                    padding: 10px;
-                    border-radius: 6px;
-                    margin: 5px 0;
-                    font-size: 12px;
-                ">
-                    {message}
-                </div>
-                """
-            else:
-                return f"""
-                <div style="
-                    background: #f8d7da;
-                    border: 1px solid #f5c6cb;
-                    color: #721c24;
-                    padding: 10px;
-                    border-radius: 6px;
-                    margin: 5px 0;
-                    font-size: 12px;
-                ">
-                    {message}
-                </div>
-                """
+            from app.services.sql_query_service import sql_query_service
+            success, message = await sql_query_service.test_database_connection_async()
+            return _DB_STATUS_TEMPLATE.format(
+                **(_DB_STATUS_SUCCESS_STYLE if success else _DB_STATUS_FAILURE_STYLE),
+                message=message
+            )
         except Exception as e:
-            return f"""
-            <div style="
-                background: #fff3cd;
-                border: 1px solid #ffeaa7;
-                color: #856404;
-                padding: 10px;
-                border-radius: 6px;
-                margin: 5px 0;
-                font-size: 12px;
-            ">
-                ⚠️ 연결 테스트 오류: {str(e)}
-            </div>
-            """
+            return _DB_STATUS_TEMPLATE.format(
+                **_DB_STATUS_WARNING_STYLE,
+                message=f"⚠️ 연결 테스트 오류: {str(e)}"
+            )
 
 
 # 전역 SQL 인터페이스 인스턴스
@@ -0,0 +1,196 @@
+/*
+ * 디바이스 감지 및 최적화 스크립트
+ *
+ * 디바이스/뷰포트/네트워크/배터리/선호도에 따라 body 클래스를 갱신합니다.
+ * 정적 파일로 서빙되어 브라우저에 캐시되며 defer로 로드됩니다.
+ */
+(function() {
+    // 모바일 UA 패턴 (한 번만 컴파일)
+    const MOBILE_RE = /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i;
+    
+    // 디바이스 타입 감지 - 로드 이후 바뀌지 않으므로 초기화 시 한 번만 호출
+    function detectDevice() {
+        const userAgent = navigator.userAgent;
+        const uaData = navigator.userAgentData;
+        // Client Hints를 지원하면 UA 문자열 검사 없이 판별
+        const isMobile = uaData ? uaData.mobile : MOBILE_RE.test(userAgent);
+        const isTablet = /iPad/.test(userAgent) || (/Android/.test(userAgent) && !/Mobile/.test(userAgent));
+        const isTouchDevice = 'ontouchstart' in window || navigator.maxTouchPoints > 0;
+        
+        return {
+            isMobile: isMobile && !isTablet,
+            isTablet: isTablet,
+            isDesktop: !isMobile && !isTablet,
+            isTouchDevice: isTouchDevice
+        };
+    }
+    
+    // 디바이스별 클래스
+    function deviceClasses(device) {
+        return [
+            device.isMobile ? 'mobile-device' : device.isTablet ? 'tablet-device' : 'desktop-device',
+            device.isTouchDevice ? 'touch-device' : 'no-touch-device'
+        ];
+    }
+    
+    // 현재 적용된 상태 (변경될 때만 classList를 건드려 스타일 재계산을 줄임)
+    let currentViewport = null;
+    let slowConnection = null;
+    let lowBattery = null;
+    
+    // 뷰포트 크기 구간
+    function viewportClass() {
+        const width = window.innerWidth;
+        return width < 480 ? 'viewport-xs'
+            : width < 768 ? 'viewport-sm'
+            : width < 1024 ? 'viewport-md'
+            : width < 1440 ? 'viewport-lg'
+            : 'viewport-xl';
+    }
+    
+    // 뷰포트 크기 감지 및 클래스 적용
+    function updateViewportClasses() {
+        const next = viewportClass();
+        
+        if (next === currentViewport) {
+            return;
+        }
+        
+        const body = document.body;
+        if (currentViewport) {
+            body.classList.remove(currentViewport);
+        }
+        body.classList.add(next);
+        currentViewport = next;
+    }
+    
+    // 느린 연결 여부
+    function isSlowConnection() {
+        const effectiveType = navigator.connection.effectiveType;
+        return effectiveType === 'slow-2g' || effectiveType === '2g';
+    }
+    
+    // 네트워크 상태 감지 (지원되는 경우)
+    function handleNetworkChange() {
+        if ('connection' in navigator) {
+            const isSlow = isSlowConnection();
+            
+            if (isSlow === slowConnection) {
+                return;
+            }
+            slowConnection = isSlow;
+            
+            const body = document.body;
+            if (isSlow) {
+                // 느린 연결 시 애니메이션 비활성화
+                body.classList.add('slow-connection', 'reduced-motion');
+            } else {
+                body.classList.remove('slow-connection');
+            }
+        }
+    }
+    
+    // 배터리 상태 감지 (지원되는 경우)
+    function handleBatteryChange() {
+        if ('getBattery' in navigator) {
+            navigator.getBattery().then(function(battery) {
+                function updateBatteryStatus() {
+                    const isLow = battery.level < 0.2 && !battery.charging;
+                    
+                    if (isLow === lowBattery) {
+                        return;
+                    }
+                    lowBattery = isLow;
+                    
+                    const body = document.body;
+                    if (isLow) {
+                        // 배터리 부족 시 성능 최적화
+                        body.classList.add('low-battery', 'reduced-motion');
+                    } else {
+                        body.classList.remove('low-battery');
+                    }
+                }
+                
+                battery.addEventListener('levelchange', updateBatteryStatus, { passive: true });
+                battery.addEventListener('chargingchange', updateBatteryStatus, { passive: true });
+                updateBatteryStatus();
+            });
+        }
+    }
+    
+    // 다크 모드/모션 감소 선호도
+    const darkModeQuery = window.matchMedia('(prefers-color-scheme: dark)');
+    const reducedMotionQuery = window.matchMedia('(prefers-reduced-motion: reduce)');
+    
+    // 다크 모드 선호도 변경 감지
+    function handleColorSchemeChange(e) {
+        document.body.classList.toggle('prefers-dark', e.matches);
+    }
+    
+    // 모션 선호도 변경 감지
+    function handleMotionPreference(e) {
+        document.body.classList.toggle('prefers-reduced-motion', e.matches);
+    }
+    
+    // 브라우저가 유휴 상태일 때 실행 (미지원 시 잠시 뒤 실행)
+    function whenIdle(callback) {
+        if ('requestIdleCallback' in window) {
+            window.requestIdleCallback(callback, { timeout: 2000 });
+        } else {
+            setTimeout(callback, 500);
+        }
+    }
+    
+    // 초기화
+    function init() {
+        const body = document.body;
+        
+        // 초기 클래스는 모아서 한 번에 적용 (스타일 재계산 1회)
+        const classes = deviceClasses(detectDevice());
+        currentViewport = viewportClass();
+        classes.push(currentViewport);
+        if ('connection' in navigator) {
+            slowConnection = isSlowConnection();
+            if (slowConnection) {
+                classes.push('slow-connection', 'reduced-motion');
+            }
+        }
+        if (darkModeQuery.matches) {
+            classes.push('prefers-dark');
+        }
+        if (reducedMotionQuery.matches) {
+            classes.push('prefers-reduced-motion');
+        }
+        body.classList.add(...classes);
+        
+        // 뷰포트 크기 변화 감지 (ResizeObserver는 레이아웃 변경 시점에 묶어서 통지)
+        if (typeof ResizeObserver !== 'undefined') {
+            new ResizeObserver(updateViewportClasses).observe(document.documentElement);
+        } else {
+            let resizeTimeout;
+            window.addEventListener('resize', function() {
+                clearTimeout(resizeTimeout);
+                resizeTimeout = setTimeout(updateViewportClasses, 150);
+            }, { passive: true });
+        }
+        
+        // 배터리 조회와 네트워크 변경 감시는 첫 화면과 무관하므로 유휴 시간에 설정
+        whenIdle(function() {
+            handleBatteryChange();
+            if ('connection' in navigator) {
+                navigator.connection.addEventListener('change', handleNetworkChange, { passive: true });
+            }
+        });
+        
+        // 선호도 변경 이벤트 리스너
+        darkModeQuery.addEventListener('change', handleColorSchemeChange, { passive: true });
+        reducedMotionQuery.addEventListener('change', handleMotionPreference, { passive: true });
+    }
+    
+    // DOM 로드 완료 후 실행
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init, { once: true });
+    } else {
+        init();
+    }
+})();
@@ -7,187 +7,92 @@
 import gradio as gr
 from typing import Dict, Any
 
+from app.utils.css_utils import minify_css
 
-class ThemeManager:
-    """테마 관리 시스템"""
-    
-    def __init__(self):
-        self.current_theme = "light"
-        self.themes = {
-            "light": self._create_light_theme(),
-            "dark": self._create_dark_theme(),
-            "blue": self._create_blue_theme(),
-            "green": self._create_green_theme()
-        }
-    
-    def get_theme(self, theme_name: str = "light") -> gr.Theme:
-        """테마 가져오기"""
-        return self.themes.get(theme_name, self.themes["light"])
-    
-    def get_custom_css(self, theme_name: str = "light") -> str:
-        """테마별 커스텀 CSS 가져오기"""
-        css_map = {
-            "light": self._get_light_css(),
-            "dark": self._get_dark_css(),
-            "blue": self._get_blue_css(),
-            "green": self._get_green_css()
-        }
-        return css_map.get(theme_name, css_map["light"])
-    
-    def _create_light_theme(self) -> gr.Theme:
-        """라이트 테마 생성"""
-        return gr.themes.Soft(
-            primary_hue="blue",
-            secondary_hue="purple",
-            neutral_hue="gray",
-            font=gr.themes.GoogleFont("Inter"),
-            text_size="sm"
-        )
-    
-    def _create_dark_theme(self) -> gr.Theme:
-        """다크 테마 생성"""
-        return gr.themes.Monochrome(
-            primary_hue="blue",
-            secondary_hue="purple",
-            neutral_hue="slate",
-            font=gr.themes.GoogleFont("Inter"),
-            text_size="sm"
-        )
-    
-    def _create_blue_theme(self) -> gr.Theme:
-        """블루 테마 생성"""
-        return gr.themes.Ocean(
-            primary_hue="blue",
-            secondary_hue="cyan",
-            neutral_hue="blue",
-            font=gr.themes.GoogleFont("Inter"),
-            text_size="sm"
-        )
-    
-    def _create_green_theme(self) -> gr.Theme:
-        """그린 테마 생성"""
-        return gr.themes.Base(
-            primary_hue="green",
-            secondary_hue="emerald",
-            neutral_hue="green",
-            font=gr.themes.GoogleFont("Inter"),
-            text_size="sm"
-        )
-    
-    def _get_light_css(self) -> str:
-        """라이트 테마 CSS"""
-        return """
-        /* 라이트 테마 전용 스타일 */
-        .gradio-container {
-            background: #ffffff;
-            color: #1f2937;
-        }
+# 테마 공통 CSS - 선택자 구조는 한 번만 두고 테마별 색상 값만 채워 넣음
+# (CSS 변수로 두면 페이지마다 한 테마만 전송되는데도 변수 선언/참조만큼 CSS가 커지므로 로드 시 치환)
+_THEME_BASE_TEMPLATE = """
+        .gradio-container {{
+            background: {bg};
+            color: {fg};
+        }}
         
-        .gr-button-primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+        .gr-button-primary {{
+            background: {primary_gradient} !important;
             color: white !important;
-        }
+        }}
         
-        .chat-container {
-            background: #f9fafb;
-            border-color: #e5e7eb;
-        }
+        .chat-container {{
+            background: {chat_bg};
+            border-color: {border};
+        }}
         
-        .sidebar-panel {
-            background: #ffffff;
-            border-color: #e5e7eb;
-        }
+        .sidebar-panel {{
+            background: {panel_bg};
+            border-color: {border};
+        }}
         """
-    
-    def _get_dark_css(self) -> str:
-        """다크 테마 CSS"""
-        return """
-        /* 다크 테마 전용 스타일 */
-        .gradio-container {
-            background: #1f2937;
-            color: #f9fafb;
-        }
-        
-        .gr-button-primary {
-            background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%) !important;
-            color: white !important;
-        }
-        
-        .chat-container {
-            background: #374151;
-            border-color: #4b5563;
-        }
-        
-        .sidebar-panel {
-            background: #374151;
-            border-color: #4b5563;
-        }
-        
-        .gr-textbox {
-            background: #374151 !important;
-            border-color: #4b5563 !important;
-            color: #f9fafb !important;
-        }
-        """
-    
-    def _get_blue_css(self) -> str:
-        """블루 테마 CSS"""
-        return """
-        /* 블루 테마 전용 스타일 */
-        .gradio-container {
-            background: #f0f9ff;
-            color: #1e3a8a;
-        }
-        
-        .gr-button-primary {
-            background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%) !important;
-            color: white !important;
-        }
-        
-        .chat-container {
-            background: #dbeafe;
-            border-color: #93c5fd;
-        }
-        
-        .sidebar-panel {
-            background: #ffffff;
-            border-color: #93c5fd;
-        }
-        """
-    
-    def _get_green_css(self) -> str:
-        """그린 테마 CSS"""
-        return """
-        /* 그린 테마 전용 스타일 */
-        .gradio-container {
-            background: #f0fdf4;
-            color: #14532d;
-        }
-        
-        .gr-button-primary {
-            background: linear-gradient(135deg, #16a34a 0%, #15803d 100%) !important;
-            color: white !important;
-        }
-        
-        .chat-container {
-            background: #dcfce7;
-            border-color: #86efac;
-        }
-        
-        .sidebar-panel {
-            background: #ffffff;
-            border-color: #86efac;
-        }
+
+# 테마별 색상 값
+_THEME_COLORS: Dict[str, Dict[str, str]] = {
+    "light": {
+        "bg": "#ffffff",
+        "fg": "#1f2937",
+        "primary_gradient": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+        "chat_bg": "#f9fafb",
+        "panel_bg": "#ffffff",
+        "border": "#e5e7eb"
+    },
+    "dark": {
+        "bg": "#1f2937",
+        "fg": "#f9fafb",
+        "primary_gradient": "linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%)",
+        "chat_bg": "#374151",
+        "panel_bg": "#374151",
+        "border": "#4b5563"
+    },
+    "blue": {
+        "bg": "#f0f9ff",
+        "fg": "#1e3a8a",
+        "primary_gradient": "linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%)",
+        "chat_bg": "#dbeafe",
+        "panel_bg": "#ffffff",
+        "border": "#93c5fd"
+    },
+    "green": {
+        "bg": "#f0fdf4",
+        "fg": "#14532d",
+        "primary_gradient": "linear-gradient(135deg, #16a34a 0%, #15803d 100%)",
+        "chat_bg": "#dcfce7",
+        "panel_bg": "#ffffff",
+        "border": "#86efac"
+    }
+}
+
+# 특정 테마에만 있는 추가 규칙 (공통 CSS와 같은 색상 값으로 채움)
+_THEME_EXTRA_TEMPLATES = {
+    "dark": """
+        .gr-textbox {{
+            background: {chat_bg} !important;
+            border-color: {border} !important;
+            color: {fg} !important;
+        }}
         """
+}
 
 
-class AnimationCSS:
-    """애니메이션 CSS 모음"""
-    
-    @staticmethod
-    def get_animations() -> str:
-        """모든 애니메이션 CSS 반환"""
-        return """
+def _build_theme_css(theme_name: str) -> str:
+    """공통 CSS와 테마 전용 규칙에 테마 색상 값을 채워 조합"""
+    colors = _THEME_COLORS[theme_name]
+    template = _THEME_BASE_TEMPLATE + _THEME_EXTRA_TEMPLATES.get(theme_name, "")
+    return template.format(**colors)
+
+
+# 테마 이름별 압축된 CSS (조합과 주석/공백 제거는 모듈 로드 시 한 번만 수행)
+_CSS_MAP = {name: minify_css(_build_theme_css(name)) for name in _THEME_COLORS}
+
+# 애니메이션 CSS
+_ANIMATIONS_CSS = """
         /* 페이드 인 애니메이션 */
         @keyframes fadeIn {
             from { opacity: 0; transform: translateY(20px); }
@@ -268,20 +173,108 @@ class AnimationCSS:
             box-shadow: 0 0 30px rgba(102, 126, 234, 0.5);
         }
         
-        /* 반응형 그리드 */
+        /* 반응형 그리드 - 화면별 열 개수는 반응형 미디어 시트에서 지정 */
         .responsive-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 1rem;
         }
-        
-        @media (max-width: 768px) {
-            .responsive-grid {
-                grid-template-columns: 1fr;
-            }
-        }
         """
 
+# 테마 CSS와 애니메이션 CSS를 미리 이어 붙인 전체 CSS (요청 시 문자열 조합 없음)
+_MINIFIED_ANIMATIONS_CSS = minify_css(_ANIMATIONS_CSS)
+_FULL_CSS_MAP = {name: css + _MINIFIED_ANIMATIONS_CSS for name, css in _CSS_MAP.items()}
+
+
+class ThemeManager:
+    """테마 관리 시스템"""
+    
+    def __init__(self):
+        self.current_theme = "light"
+        self.themes = {
+            "light": self._create_light_theme(),
+            "dark": self._create_dark_theme(),
+            "blue": self._create_blue_theme(),
+            "green": self._create_green_theme()
+        }
+    
+    def get_theme(self, theme_name: str = "light") -> gr.Theme:
+        """테마 가져오기"""
+        return self.themes.get(theme_name, self.themes["light"])
+    
+    def get_custom_css(self, theme_name: str = "light") -> str:
+        """테마별 커스텀 CSS 가져오기 (압축됨)"""
+        return _CSS_MAP.get(theme_name, _CSS_MAP["light"])
+    
+    def get_full_css(self, theme_name: str = "light") -> str:
+        """테마별 커스텀 CSS와 애니메이션 CSS를 합친 전체 CSS 가져오기 (압축됨)"""
+        return _FULL_CSS_MAP.get(theme_name, _FULL_CSS_MAP["light"])
+    
+    def _create_light_theme(self) -> gr.Theme:
+        """라이트 테마 생성"""
+        return gr.themes.Soft(
+            primary_hue="blue",
+            secondary_hue="purple",
+            neutral_hue="gray",
+            font=gr.themes.GoogleFont("Inter"),
+            text_size="sm"
+        )
+    
+    def _create_dark_theme(self) -> gr.Theme:
+        """다크 테마 생성"""
+        return gr.themes.Monochrome(
+            primary_hue="blue",
+            secondary_hue="purple",
+            neutral_hue="slate",
+            font=gr.themes.GoogleFont("Inter"),
+            text_size="sm"
+        )
+    
+    def _create_blue_theme(self) -> gr.Theme:
+        """블루 테마 생성"""
+        return gr.themes.Ocean(
+            primary_hue="blue",
+            secondary_hue="cyan",
+            neutral_hue="blue",
+            font=gr.themes.GoogleFont("Inter"),
+            text_size="sm"
+        )
+    
+    def _create_green_theme(self) -> gr.Theme:
+        """그린 테마 생성"""
+        return gr.themes.Base(
+            primary_hue="green",
+            secondary_hue="emerald",
+            neutral_hue="green",
+            font=gr.themes.GoogleFont("Inter"),
+            text_size="sm"
+        )
+    
+    def _get_light_css(self) -> str:
+        """라이트 테마 CSS"""
+        return _CSS_MAP["light"]
+    
+    def _get_dark_css(self) -> str:
+        """다크 테마 CSS"""
+        return _CSS_MAP["dark"]
+    
+    def _get_blue_css(self) -> str:
+        """블루 테마 CSS"""
+        return _CSS_MAP["blue"]
+    
+    def _get_green_css(self) -> str:
+        """그린 테마 CSS"""
+        return _CSS_MAP["green"]
+
+
+class AnimationCSS:
+    """애니메이션 CSS 모음"""
+    
+    @staticmethod
+    def get_animations() -> str:
+        """모든 애니메이션 CSS 반환"""
+        return _ANIMATIONS_CSS
+
 
 class ColorPalette:
     """색상 팔레트 정의"""
@@ -0,0 +1,89 @@
+"""
+CSS 유틸리티
+
+클라이언트로 전송되는 CSS 문자열을 압축하는 유틸리티 함수들을 제공합니다.
+"""
+
+import re
+from typing import List
+try:
+    import rcssmin
+    RCSSMIN_AVAILABLE = True
+except ImportError:
+    RCSSMIN_AVAILABLE = False
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_RE = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """
+    CSS 문자열을 압축합니다.
+    
+    rcssmin이 설치되어 있으면 사용하고, 없으면 주석 제거 및 공백 축약만 수행합니다.
+    
+    Args:
+        css: 원본 CSS 문자열
+    
+    Returns:
+        str: 압축된 CSS 문자열
+    """
+    if RCSSMIN_AVAILABLE:
+        return rcssmin.cssmin(css)
+    
+    css = _COMMENT_RE.sub("", css)
+    css = _WHITESPACE_RE.sub(" ", css)
+    css = _PUNCTUATION_RE.sub(r"\1", css)
+    css = _COLON_RE.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _split_top_level_blocks(css: str) -> List[str]:
+    """압축된 CSS를 최상위 규칙 단위로 분리"""
+    blocks, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append(css[start:i + 1])
+                start = i + 1
+    if css[start:].strip():
+        blocks.append(css[start:])
+    return blocks
+
+
+def merge_media_queries(css: str) -> str:
+    """
+    바로 이어서 나오는 같은 조건의 @media 블록을 하나로 병합합니다.
+    
+    사이에 다른 규칙이 있는 블록은 합치면 캐스케이드 순서가 바뀌므로 그대로 둡니다.
+    압축된 CSS(minify_css 결과)를 입력으로 가정합니다.
+    
+    Args:
+        css: 압축된 CSS 문자열
+    
+    Returns:
+        str: 인접한 @media 블록이 병합된 CSS 문자열
+    """
+    merged: List[str] = []
+    previous_prelude = None
+    
+    for block in _split_top_level_blocks(css):
+        if not block.startswith("@media"):
+            previous_prelude = None
+            merged.append(block)
+            continue
+        
+        prelude, body = block.split("{", 1)
+        if prelude == previous_prelude:
+            # 앞 블록의 닫는 괄호를 떼고 이번 블록 본문(닫는 괄호 포함)을 이어 붙임
+            merged[-1] = merged[-1][:-1] + body
+        else:
+            merged.append(block)
+        previous_prelude = prelude
+    
+    return "".join(merged)
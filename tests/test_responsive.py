@@ -57,6 +57,36 @@ class TestResponsiveDesign:
         assert "@media (prefers-color-scheme: dark)" in css
         assert "@media (prefers-reduced-motion: reduce)" in css
         assert "@media (prefers-contrast: high)" in css
+    
+    def test_media_stylesheets(self):
+        """미디어 쿼리별 스타일시트 테스트"""
+        sheets = self.responsive.get_media_stylesheets()
+        css = self.responsive.get_responsive_css()
+        
+        # 항상 적용되는 기본 시트는 첫 화면용 CSS로 분리
+        assert self.responsive.get_critical_css() in css
+        
+        for path, media in sheets:
+            assert path.exists()
+            assert f"@media {media}" in css
+        
+        # 사용자 선호도 시트는 화면별 시트와 분리되어 조건부로 로드
+        preference_sheets = self.responsive.get_preference_stylesheets()
+        assert preference_sheets
+        for path, media in preference_sheets:
+            assert path.exists()
+            assert media.startswith("(prefers-")
+            assert (path, media) not in sheets
+    
+    def test_media_stylesheets_no_duplicate_rules(self):
+        """미디어 쿼리별 스타일시트 내 중복 선택자 테스트"""
+        import re
+        from app.utils.css_utils import minify_css
+        
+        for path, _ in self.responsive.get_media_stylesheets():
+            selectors = re.findall(r"([^{}]+)\{", minify_css(path.read_text(encoding="utf-8")))
+            # 같은 선택자는 하나의 규칙으로 합쳐져 있어야 함
+            assert len(selectors) == len(set(selectors)), path.name
 
 
 class TestAccessibilityFeatures:
@@ -251,6 +281,40 @@ class TestIntegration:
         close_braces = combined_css.count('}')
         assert open_braces == close_braces
     
+    def test_minified_css(self):
+        """CSS 압축 테스트"""
+        from app.utils.css_utils import minify_css
+        
+        responsive_css = ResponsiveDesign().get_responsive_css()
+        minified = minify_css(responsive_css)
+        
+        assert len(minified) < len(responsive_css)
+        assert "/*" not in minified
+        assert minified.count('{') == responsive_css.count('{')
+        assert "@media (max-width:640px)" in minified
+    
+    def test_merge_media_queries(self):
+        """중복 @media 블록 병합 테스트"""
+        from app.utils.css_utils import minify_css, merge_media_queries
+        
+        css = minify_css("""
+        @media (max-width: 768px) { .a { color: red; } }
+        @media (max-width: 768px) { .c { color: green; } }
+        .b { color: blue; }
+        """)
+        merged = merge_media_queries(css)
+        
+        assert merged.count("@media") == 1
+        assert merged == "@media (max-width:768px){.a{color:red}.c{color:green}}.b{color:blue}"
+        
+        # 사이에 다른 규칙이 있으면 캐스케이드 순서를 지키기 위해 병합하지 않음
+        css = minify_css("""
+        @media (max-width: 768px) { .a { color: red; } }
+        .a { color: blue; }
+        @media (max-width: 768px) { .b { color: green; } }
+        """)
+        assert merge_media_queries(css) == css
+    
     def test_html_components_validity(self):
         """HTML 컴포넌트 유효성 테스트"""
         accessibility = AccessibilityFeatures()
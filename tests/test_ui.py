@@ -72,11 +72,43 @@ class TestChatHandler:
         assert len(self.chat_handler.conversation_history) > 0
         
         # 초기화
-        cleared_history, cleared_input = self.chat_handler.clear_chat()
+        cleared_history, cleared_input, cleared_offset = self.chat_handler.clear_chat()
         
         assert cleared_history == []
         assert cleared_input == ""
+        assert cleared_offset == 0  # 더 보기로 늘린 표시 구간도 초기화
         assert len(self.chat_handler.conversation_history) == 0
+    
+    def test_render_history(self):
+        """채팅 히스토리 HTML 렌더링 테스트"""
+        history = [("**굵게** <script>alert(1)</script>", "- 항목"), ("대기 중", None)]
+        
+        rendered = self.chat_handler.render_history(history)
+        
+        assert "<strong>굵게</strong>" in rendered[0][0]
+        assert "<script>" not in rendered[0][0]  # 원시 HTML은 이스케이프
+        assert "<li>항목</li>" in rendered[0][1]
+        assert rendered[1][1] is None
+        assert self.chat_handler.render_history(None) == []
+    
+    def test_history_window(self):
+        """채팅 히스토리 표시 구간 테스트"""
+        from app.ui.handlers import _CHAT_WINDOW
+        
+        history = [(f"질문 {i}", f"답변 {i}") for i in range(_CHAT_WINDOW + 5)]
+        
+        rendered = self.chat_handler.render_history(history)
+        assert len(rendered) == _CHAT_WINDOW
+        assert "질문 5" in rendered[0][0]
+        
+        # 이전 대화는 남은 개수만큼만 추가로 불러옴
+        rendered, offset = self.chat_handler.load_more_history(history, 0)
+        assert offset == 5
+        assert len(rendered) == len(history)
+        
+        # 가려진 대화가 남아 있을 때만 더 보기 버튼 표시
+        assert self.chat_handler.get_load_more_update(history, 0)["visible"] is True
+        assert self.chat_handler.get_load_more_update(history, offset)["visible"] is False
 
 
 class TestFileHandler:
@@ -119,6 +151,21 @@ class TestFileHandler:
         assert ":" in result  # HH:MM 형식
         assert len(result) == 5  # HH:MM은 5글자
     
+    def test_file_icon_formatting(self):
+        """파일 아이콘 포맷팅 테스트"""
+        icon = self.file_handler._format_file_icon({'name': 'data.csv'})
+        assert 'aria-hidden="true"' in icon
+        
+        # 미리보기 이미지는 지연 로딩
+        icon = self.file_handler._format_file_icon({'name': 'chart.png', 'thumbnail': '/thumbs/chart.png'})
+        assert 'loading="lazy"' in icon
+        assert 'decoding="async"' in icon
+        
+        # 미리보기 경로의 따옴표는 속성 밖으로 새지 않도록 이스케이프
+        icon = self.file_handler._format_file_icon({'name': 'x.png', 'thumbnail': 'x.png" onerror="alert(1)'})
+        assert 'onerror="alert(1)"' not in icon
+        assert '&quot;' in icon
+    
     def test_time_formatting_invalid(self):
         """잘못된 시간 포맷 테스트"""
         invalid_timestamp = "invalid_timestamp"
@@ -282,6 +329,16 @@ class TestThemeManager:
         css = self.theme_manager.get_custom_css("dark")
         assert isinstance(css, str)
         assert len(css) > 0
+    
+    def test_get_full_css(self):
+        """테마 + 애니메이션 전체 CSS 가져오기 테스트"""
+        css = self.theme_manager.get_full_css("dark")
+        assert css.startswith(self.theme_manager.get_custom_css("dark"))
+        assert "@keyframes fadeIn" in css
+        assert "/*" not in css  # 주석은 미리 제거됨
+        
+        # 알 수 없는 테마는 라이트 테마로 대체
+        assert self.theme_manager.get_full_css("invalid_theme") == self.theme_manager.get_full_css("light")
 
 
 class TestColorPalette: